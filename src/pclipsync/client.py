@@ -40,6 +40,7 @@ async def run_client(socket_path: str) -> None:
         window=window,
         clipboard_atom=clipboard_atom,
         incr_atom=display.intern_atom("INCR"),
+        timestamp_atom=display.intern_atom("PCLIPSYNC_TIMESTAMP"),
     )
 
     # Register signal handlers for clean shutdown
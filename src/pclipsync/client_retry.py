@@ -14,7 +14,11 @@ import logging
 
 from pclipsync.sync import run_sync_loop
 from pclipsync.sync_state import ClipboardState
-from pclipsync.protocol import ProtocolError
+from pclipsync.protocol import (
+    STREAM_READER_LIMIT,
+    ProtocolError,
+    configure_stream_writer,
+)
 
 
 STALE_SOCKET_MESSAGE = """
@@ -59,9 +63,13 @@ async def connect_to_server(
         ConnectionError: If connection fails (socket not found, refused, etc).
     """
     try:
-        return await asyncio.open_unix_connection(socket_path)
+        reader, writer = await asyncio.open_unix_connection(
+            socket_path, limit=STREAM_READER_LIMIT
+        )
     except OSError as e:
         raise ConnectionError(f"Failed to connect to {socket_path}: {e}") from e
+    configure_stream_writer(writer)
+    return reader, writer
 
 
 async def run_client_connection(
@@ -88,3 +88,44 @@ def set_clipboard_content(
     except Exception as e:
         logger.error("Failed to set clipboard content: %s", e)
         return False
+
+
+def set_clipboard_content_many(
+    display: Display, window: Window, selection_atoms: tuple[int, ...]
+) -> list[int]:
+    """Take ownership of several selections for clipboard content.
+
+    Queues every SetSelectionOwner request before verifying any of them, so
+    all ownership changes reach the X server in a single write instead of
+    one flush per selection.
+
+    Args:
+        display: The X11 display connection.
+        window: The window to own the selections.
+        selection_atoms: The selection atoms (CLIPBOARD and/or PRIMARY).
+
+    Returns:
+        The selection atoms whose ownership was acquired and verified, in
+        request order. On an X error, those verified before it.
+    """
+    import logging
+
+    from Xlib import X
+    from Xlib.error import ConnectionClosedError, XError
+
+    logger = logging.getLogger(__name__)
+
+    acquired: list[int] = []
+    try:
+        # Take ownership of every selection; the first reply request below
+        # flushes them all together
+        for selection_atom in selection_atoms:
+            window.set_selection_owner(selection_atom, X.CurrentTime)
+
+        # Verify we got ownership
+        for selection_atom in selection_atoms:
+            if display.get_selection_owner(selection_atom) == window:
+                acquired.append(selection_atom)
+    except (XError, ConnectionClosedError) as e:
+        logger.error("Failed to set clipboard content: %s", e)
+    return acquired
@@ -21,8 +21,10 @@ if TYPE_CHECKING:
 
 from dataclasses import dataclass
 
+from pclipsync.protocol import MAX_CONTENT_SIZE
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PropertyReadResult:
     """Result of reading an X11 selection property.
 
@@ -49,6 +51,11 @@ CLIPBOARD_TIMEOUT: float = 2.0
 # Timeout in seconds for each INCR chunk during incremental transfers
 INCR_CHUNK_TIMEOUT: float = 5.0
 
+# get_full_property's sizehint is in 32-bit units and defaults to 40 bytes,
+# so anything larger took a second GetProperty; asking for the whole
+# content limit up front reads any acceptable property in one round trip
+PROPERTY_SIZE_HINT: int = MAX_CONTENT_SIZE // 4 + 1
+
 
 async def read_clipboard_content(
     display: Display,
@@ -90,9 +97,10 @@ async def read_clipboard_content(
             logger.debug("No selection owner for atom %s", selection_atom)
             return None
 
-        # Request clipboard content via X11 selection protocol
-        utf8_atom = display.intern_atom("UTF8_STRING")
-        prop_atom = display.intern_atom("PCLIPSYNC_SEL")
+        # Request clipboard content via X11 selection protocol; get_atom
+        # caches per display so these only round-trip on the first read
+        utf8_atom = display.get_atom("UTF8_STRING")
+        prop_atom = display.get_atom("PCLIPSYNC_SEL")
         
         # Request selection conversion
         window.convert_selection(selection_atom, utf8_atom, prop_atom, X.CurrentTime)
@@ -166,7 +174,12 @@ def _wait_for_selection(
     if result.is_incr:
         logger.debug("Starting INCR transfer")
         return _handle_incr_transfer(
-            display, window, prop_atom, deferred_events, INCR_CHUNK_TIMEOUT
+            display,
+            window,
+            prop_atom,
+            deferred_events,
+            INCR_CHUNK_TIMEOUT,
+            result.estimated_size,
         )
 
     # Normal (non-INCR) content
@@ -193,7 +206,9 @@ def _read_selection_property(
     logger = logging.getLogger(__name__)
     
     try:
-        prop = window.get_full_property(prop_atom, X.AnyPropertyType)
+        prop = window.get_full_property(
+            prop_atom, X.AnyPropertyType, sizehint=PROPERTY_SIZE_HINT
+        )
         
         if prop is None:
             logger.debug("Selection property was empty")
@@ -202,7 +217,15 @@ def _read_selection_property(
         # Check for INCR transfer indication
         if prop.property_type == incr_atom:
             # DON'T delete property - caller handles deletion as handshake signal
-            estimated_size = int.from_bytes(bytes(prop.value), byteorder="little")
+            # python-xlib decodes format-32 data as an array of ints; raw
+            # bytes only appear for format 8 and are read without copying
+            value = prop.value
+            if isinstance(value, (bytes, bytearray)):
+                estimated_size = int.from_bytes(
+                    memoryview(value)[:4], byteorder="little"
+                )
+            else:
+                estimated_size = int(value[0]) if len(value) else 0
             logger.debug("INCR transfer detected, estimated size: %d", estimated_size)
             return PropertyReadResult(content=None, is_incr=True, estimated_size=estimated_size)
 
@@ -226,7 +249,8 @@ def _read_chunk_property(
 
     Simple property reader for INCR chunks. Returns the raw bytes from
     the property, or empty bytes for zero-length chunk (end marker).
-    Does NOT check for INCR type (already handled upstream).
+    Does NOT check for INCR type (already handled upstream). The delete
+    is queued but not flushed.
 
     Args:
         display: The X11 display connection.
@@ -243,9 +267,12 @@ def _read_chunk_property(
     logger = logging.getLogger(__name__)
 
     try:
-        prop = window.get_full_property(prop_atom, X.AnyPropertyType)
+        prop = window.get_full_property(
+            prop_atom, X.AnyPropertyType, sizehint=PROPERTY_SIZE_HINT
+        )
+        # Queued only: wait_for_property_notify flushes before it blocks,
+        # so the delete goes out in the same write as anything after it
         window.delete_property(prop_atom)
-        display.flush()
 
         if prop is None:
             # Zero-length chunk signals end of INCR transfer
@@ -266,6 +293,7 @@ def _handle_incr_transfer(
     prop_atom: int,
     deferred_events: list["Event"],
     chunk_timeout: float,
+    estimated_size: int = 0,
 ) -> bytes | None:
     """Handle INCR (incremental) clipboard transfer protocol.
 
@@ -285,22 +313,26 @@ def _handle_incr_transfer(
         prop_atom: The property atom being used for transfer.
         deferred_events: List to collect events deferred during transfer.
         chunk_timeout: Timeout in seconds for each chunk.
+        estimated_size: Size hint from the INCR property, used to
+            preallocate the buffer (capped at MAX_CONTENT_SIZE).
 
     Returns:
         Complete content bytes on success, None on failure or timeout.
     """
     # Initial handshake: delete property to signal readiness for first chunk
+    # (flushed by wait_for_property_notify before it blocks)
     window.delete_property(prop_atom)
-    display.flush()
-
 
     from pclipsync.selection_utils import wait_for_property_notify
-    from pclipsync.protocol import MAX_CONTENT_SIZE
     import logging
 
     logger = logging.getLogger(__name__)
 
-    buffer = bytearray()
+    # ICCCM gives the INCR size as a lower bound, so fill a buffer of that
+    # size in place and only let it grow once the owner sends more
+    capacity = min(max(estimated_size, 0), MAX_CONTENT_SIZE)
+    buffer = bytearray(capacity)
+    length = 0
 
     # Chunk accumulation loop
     while True:
@@ -321,13 +353,22 @@ def _handle_incr_transfer(
 
         # Zero-length chunk signals end of transfer
         if len(chunk) == 0:
+            # Nothing waits on us after the end marker, but send its delete
+            display.flush()
+            del buffer[length:]
             return bytes(buffer)
 
-        # Append chunk to buffer
-        buffer.extend(chunk)
+        # Copy chunk into the preallocated space, growing past the hint
+        end = length + len(chunk)
+        if end <= capacity:
+            buffer[length:end] = chunk
+        else:
+            buffer[length:] = chunk
+            capacity = end
+        length = end
 
         # Check accumulated size against limit
-        if len(buffer) > MAX_CONTENT_SIZE:
+        if length > MAX_CONTENT_SIZE:
             logger.warning(
                 "INCR transfer exceeds %d bytes limit, aborting", MAX_CONTENT_SIZE
             )
@@ -57,5 +57,4 @@ def unsubscribe_incr_requestor(
         unsubscribe_requestor_events(display, state.requestor)
 
     # Remove the transfer entry
-    if transfer_key in pending_incr_sends:
-        del pending_incr_sends[transfer_key]
+    pending_incr_sends.pop(transfer_key, None)
@@ -6,24 +6,76 @@ blocking the asyncio event loop.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from Xlib import X
+from Xlib.ext.xfixes import SetSelectionOwnerNotify
+
+from pclipsync.clipboard_selection_incr_events import is_incr_send_event
+from pclipsync.clipboard_selection_incr_handle import handle_incr_send_event
+
 if TYPE_CHECKING:
     from Xlib.display import Display
     from Xlib.protocol.rq import Event
     from pclipsync.clipboard_selection_incr_state import IncrSendState
 
 
+def _collect_event(
+    display: Display,
+    event: Event,
+    events: list[Event],
+    pending_incr_sends: dict[tuple[int, int], IncrSendState] | None,
+    property_deletes: dict[tuple[int, int], Event],
+) -> None:
+    """Collect an event for processing by the caller."""
+    events.append(event)
+
+
+def _route_incr_send_event(
+    display: Display,
+    event: Event,
+    events: list[Event],
+    pending_incr_sends: dict[tuple[int, int], IncrSendState] | None,
+    property_deletes: dict[tuple[int, int], Event],
+) -> None:
+    """Route an event to the INCR send machinery if it matches a transfer.
+
+    PropertyDelete events are bucketed per (requestor, property) so only
+    the latest one per transfer is handled once the queue is drained.
+    DestroyNotify is handled immediately so the transfer is gone before
+    any bucketed PropertyDelete for that window is processed.
+    """
+    is_match, evt_type = is_incr_send_event(event, pending_incr_sends)
+    if not is_match or pending_incr_sends is None or evt_type is None:
+        return
+    if evt_type == "property_delete":
+        property_deletes[(event.window.id, event.atom)] = event
+    else:
+        handle_incr_send_event(display, event, evt_type, pending_incr_sends)
+
+
+# Core event type -> handler, built once so each event costs one dict probe.
+# SetSelectionOwnerNotify is an extension event whose type code is assigned
+# per display, so it is matched by class instead.
+_EVENT_ROUTES: dict[int, Callable[..., None]] = {
+    X.SelectionRequest: _collect_event,
+    X.PropertyNotify: _route_incr_send_event,
+    X.DestroyNotify: _route_incr_send_event,
+}
+
+
 def process_pending_events(
-    display: "Display",
-    deferred_events: list["Event"] | None = None,
-    pending_incr_sends: dict[tuple[int, int], "IncrSendState"] | None = None,
-) -> list["Event"]:
+    display: Display,
+    deferred_events: list[Event] | None = None,
+    pending_incr_sends: dict[tuple[int, int], IncrSendState] | None = None,
+) -> list[Event]:
     """Process only events already pending without blocking.
 
     Checks pending_events() before processing to avoid stalling the asyncio
     event loop. Returns a list of relevant events (XFixesSelectionNotify
-    and SelectionRequest) for processing.
+    and SelectionRequest) for processing. INCR PropertyDelete events are
+    coalesced per transfer and handled after the queue is drained.
 
     Args:
         display: The X11 display connection.
@@ -35,11 +87,8 @@ def process_pending_events(
     Returns:
         List of pending events for processing.
     """
-    from Xlib import X
     import logging
     from pclipsync.clipboard_selection_incr_cleanup import cleanup_stale_incr_sends
-    from pclipsync.clipboard_selection_incr_events import is_incr_send_event
-    from pclipsync.clipboard_selection_incr_handle import handle_incr_send_event
     logger = logging.getLogger(__name__)
 
     if pending_incr_sends is not None:
@@ -50,16 +99,26 @@ def process_pending_events(
         events.extend(deferred_events)
         deferred_events.clear()
 
+    # Latest PropertyDelete per INCR transfer, coalesced across this drain
+    property_deletes: dict[tuple[int, int], Event] = {}
+
+    # Checked once per drain: the per-event arguments cost attribute
+    # lookups through rq.Event even when the record is dropped
+    debug = logger.isEnabledFor(logging.DEBUG)
     while display.pending_events() > 0:
         event = display.next_event()
-        logger.debug("X11 event type=%s class=%s", event.type, type(event).__name__)
-        is_match, evt_type = is_incr_send_event(event, pending_incr_sends)
-        if is_match and pending_incr_sends is not None and evt_type is not None:
-            handle_incr_send_event(display, event, evt_type, pending_incr_sends)
-            continue
-        if event.type == X.SelectionRequest:
-            events.append(event)
-        elif type(event).__name__ == "SetSelectionOwnerNotify":
+        if debug:
+            logger.debug("X11 event type=%s class=%s", event.type, type(event).__name__)
+        route = _EVENT_ROUTES.get(event.type)
+        if route is not None:
+            route(display, event, events, pending_incr_sends, property_deletes)
+        elif type(event) is SetSelectionOwnerNotify:
             events.append(event)
 
+    # One chunk per transfer per drain: INCR allows only a single chunk in
+    # flight, so extra deletes seen before our next write are duplicates
+    if pending_incr_sends is not None:
+        for event in property_deletes.values():
+            handle_incr_send_event(display, event, "property_delete", pending_incr_sends)
+
     return events
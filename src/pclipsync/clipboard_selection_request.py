@@ -45,9 +45,10 @@ def handle_selection_request(
     )
     logger = logging.getLogger(__name__)
 
-    targets_atom = display.intern_atom("TARGETS")
-    utf8_atom = display.intern_atom("UTF8_STRING")
-    timestamp_atom = display.intern_atom("TIMESTAMP")
+    # get_atom caches per display, so only the first request round-trips
+    targets_atom = display.get_atom("TARGETS")
+    utf8_atom = display.get_atom("UTF8_STRING")
+    timestamp_atom = display.get_atom("TIMESTAMP")
     logger.debug("SelectionRequest target=%s targets=%s utf8=%s STRING=%s ts=%s",
         event.target, targets_atom, utf8_atom, Xatom.STRING, timestamp_atom)
 
@@ -64,4 +65,6 @@ def handle_selection_request(
     else:
         event.property = X.NONE
 
-    send_selection_notify(event, display)
+    # Single flush sends the property change and notify in one write
+    send_selection_notify(event)
+    display.flush()
@@ -7,6 +7,8 @@ target types and sending SelectionNotify responses.
 from __future__ import annotations
 
 import logging
+import struct
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,12 +17,19 @@ if TYPE_CHECKING:
     from pclipsync.clipboard_selection_incr_state import IncrSendState
 
 
+@cache
+def _pack_targets(targets_atom: int, utf8_atom: int, timestamp_atom: int) -> bytes:
+    """Pack the supported targets as native-order 32-bit words, once per atom set."""
+    from Xlib import Xatom
+    return struct.pack("=4I", targets_atom, utf8_atom, Xatom.STRING, timestamp_atom)
+
+
 def handle_targets_request(
     event: "SelectionRequest", targets_atom: int, utf8_atom: int, timestamp_atom: int
 ) -> None:
     """Return list of supported targets."""
     from Xlib import Xatom
-    targets = [targets_atom, utf8_atom, Xatom.STRING, timestamp_atom]
+    targets = _pack_targets(targets_atom, utf8_atom, timestamp_atom)
     event.requestor.change_property(event.property, Xatom.ATOM, 32, targets)
 
 
@@ -54,8 +63,8 @@ def handle_timestamp_request(
         logger.debug("Refused TIMESTAMP request, no acquisition_time")
 
 
-def send_selection_notify(event: "SelectionRequest", display: "Display") -> None:
-    """Send SelectionNotify response."""
+def send_selection_notify(event: "SelectionRequest") -> None:
+    """Queue SelectionNotify response. Caller flushes the display."""
     from Xlib.protocol.event import SelectionNotify as SelectionNotifyEvent
     event.requestor.send_event(
         SelectionNotifyEvent(
@@ -67,4 +76,3 @@ def send_selection_notify(event: "SelectionRequest", display: "Display") -> None
         ),
         event_mask=0,
     )
-    display.flush()
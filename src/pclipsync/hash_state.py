@@ -26,14 +26,14 @@ class HashState:
     to prevent duplicate sends and echo loops.
 
     Attributes:
-        last_sent_hash: SHA-256 hex digest of last sent content, or None.
-        last_received_hash: SHA-256 hex digest of last received content, or None.
+        last_sent_hash: BLAKE2b digest of last sent content, or None.
+        last_received_hash: BLAKE2b digest of last received content, or None.
     """
 
-    last_sent_hash: str | None = None
-    last_received_hash: str | None = None
+    last_sent_hash: bytes | None = None
+    last_received_hash: bytes | None = None
 
-    def should_send(self, current_hash: str) -> bool:
+    def should_send(self, current_hash: bytes) -> bool:
         """
         Check if content should be sent based on hash comparison.
 
@@ -41,18 +41,23 @@ class HashState:
         or last_received_hash (echo of received content). Returns True otherwise.
 
         Args:
-            current_hash: SHA-256 hex digest of current clipboard content.
+            current_hash: BLAKE2b digest of current clipboard content.
 
         Returns:
             True if content should be sent, False if duplicate or echo.
         """
+        # Identity checks short-circuit when the same digest object is reused
+        if current_hash is self.last_sent_hash:
+            return False
+        if current_hash is self.last_received_hash:
+            return False
         if current_hash == self.last_sent_hash:
             return False
         if current_hash == self.last_received_hash:
             return False
         return True
 
-    def record_sent(self, hash_value: str) -> None:
+    def record_sent(self, hash_value: bytes) -> None:
         """
         Record hash of successfully sent content.
 
@@ -60,11 +65,11 @@ class HashState:
         duplicate sends of the same content.
 
         Args:
-            hash_value: SHA-256 hex digest of sent content.
+            hash_value: BLAKE2b digest of sent content.
         """
         self.last_sent_hash = hash_value
 
-    def record_received(self, hash_value: str) -> None:
+    def record_received(self, hash_value: bytes) -> None:
         """
         Record hash of received content.
 
@@ -72,7 +77,7 @@ class HashState:
         resulting XFixes event from triggering an echo send.
 
         Args:
-            hash_value: SHA-256 hex digest of received content.
+            hash_value: BLAKE2b digest of received content.
         """
         self.last_received_hash = hash_value
 
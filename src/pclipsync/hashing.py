@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-SHA-256 hashing and hash state management for loop prevention.
+BLAKE2b hashing and hash state management for loop prevention.
 
 Loop prevention is critical for clipboard synchronization to avoid infinite
 echo loops. When clipboard content is set from received data, the XFixes
@@ -8,7 +8,7 @@ extension generates a selection change event. Without tracking, this would
 trigger sending the same content back, creating an endless loop.
 
 This module provides:
-- compute_hash(): SHA-256 hex digest of clipboard content
+- compute_hash(): 128-bit BLAKE2b digest of clipboard content
 - HashState: dataclass tracking last_sent_hash and last_received_hash
 
 The hash state tracks two values:
@@ -24,16 +24,31 @@ from pclipsync.hash_state import HashState
 __all__ = ["compute_hash", "HashState"]
 
 
-def compute_hash(data: bytes) -> str:
+# Digest size in bytes. Loop prevention only needs collision resistance
+# between recent clipboard contents, so 128 bits is ample.
+HASH_DIGEST_SIZE: int = 16
+
+# Pre-initialized hasher copied per call. Copying skips parameter-block
+# setup, which dominates the cost of hashing short clipboard text.
+_BLAKE2B_PROTOTYPE = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+
+
+def compute_hash(data: bytes) -> bytes:
     """
-    Compute SHA-256 hash of clipboard content.
+    Compute BLAKE2b hash of clipboard content.
+
+    BLAKE2b is used instead of SHA-256 because it is substantially faster
+    on CPUs without SHA extensions, and loop prevention does not depend on
+    any SHA-specific property.
 
     Args:
         data: Raw clipboard content bytes to hash.
 
     Returns:
-        Hexadecimal string representation of the SHA-256 digest.
+        Raw 16-byte BLAKE2b digest.
     """
-    return hashlib.sha256(data).hexdigest()
+    hasher = _BLAKE2B_PROTOTYPE.copy()
+    hasher.update(data)
+    return hasher.digest()
 
 
@@ -13,6 +13,7 @@ This module provides encoding and decoding functions for netstrings,
 with a maximum content size of 10 MB to prevent memory exhaustion.
 """
 import asyncio
+import socket
 
 # Maximum size of clipboard content in bytes (10 MB).
 # Prevents memory exhaustion from extremely large clipboard data.
@@ -22,6 +23,23 @@ MAX_CONTENT_SIZE: int = 10485760
 # Enforced during parsing to prevent denial of service from huge length values.
 MAX_LENGTH_DIGITS: int = 8
 
+# Frames with content below this size are read together with their comma
+# terminator in one readexactly. Larger content is read on its own so the
+# bytes returned by StreamReader are passed on without a trimming copy.
+FUSED_READ_THRESHOLD: int = 65536
+
+# StreamReader buffer limit for netstring connections. Sized to hold one
+# maximum-size frame (length digits, colon, content, comma) so the
+# transport is not paused and resumed repeatedly while a large clipboard
+# arrives. The length field does not rely on this limit: it is read
+# byte-wise and bounded by MAX_LENGTH_DIGITS + 1 on its own.
+STREAM_READER_LIMIT: int = MAX_CONTENT_SIZE + MAX_LENGTH_DIGITS + 2
+
+# Kernel send buffer requested for netstring sockets. Lets a large frame be
+# handed to the kernel in a few big writes instead of bouncing off the
+# default buffer size and waiting for the peer every few kilobytes.
+SOCKET_SNDBUF_SIZE: int = 1 << 20
+
 # Goodbye message: empty netstring signaling clean shutdown.
 # Sent before intentional disconnect (SIGINT/SIGTERM).
 GOODBYE_MESSAGE: bytes = b"0:,"
@@ -37,8 +55,46 @@ def encode_netstring(data: bytes) -> bytes:
     Returns:
         Netstring-encoded bytes in format "<length>:<content>,".
     """
-    length = len(data)
-    return f"{length}:".encode("ascii") + data + b","
+    # Single join sizes the result once and copies data exactly once
+    return b"".join((b"%d:" % len(data), data, b","))
+
+
+def configure_stream_writer(writer: asyncio.StreamWriter) -> None:
+    """
+    Tune a netstring connection's writer for low-latency sends.
+
+    Drops the transport's high-water mark to zero so drain() waits until
+    each frame has been handed to the kernel, and enlarges the socket send
+    buffer so large frames are flushed in big chunks. Buffer sizing is
+    best-effort: the kernel may clamp or refuse it.
+
+    Args:
+        writer: asyncio StreamWriter for the connection.
+    """
+    writer.transport.set_write_buffer_limits(high=0)
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF_SIZE)
+    except OSError:
+        pass
+
+
+async def write_netstring(writer: asyncio.StreamWriter, data: bytes) -> None:
+    """
+    Write raw bytes to a stream as a netstring and wait for it to drain.
+
+    Hands header, content and terminator to the transport as separate
+    buffers via writelines, so the content is never copied into a combined
+    frame and the transport can send all three with one sendmsg.
+
+    Args:
+        writer: asyncio StreamWriter to write to.
+        data: Raw clipboard content bytes to send.
+    """
+    writer.writelines((b"%d:" % len(data), data, b","))
+    await writer.drain()
 
 
 def validate_content_size(data: bytes) -> bool:
@@ -78,7 +134,7 @@ async def read_netstring(reader: asyncio.StreamReader) -> bytes:
     Raises:
         ProtocolError: On invalid format, size violation, or connection closed.
     """
-    length_bytes = b""
+    length_bytes = bytearray()
     while len(length_bytes) < MAX_LENGTH_DIGITS + 1:
         byte = await reader.read(1)
         if not byte:
@@ -92,17 +148,46 @@ async def read_netstring(reader: asyncio.StreamReader) -> bytes:
         raise ProtocolError("Length field exceeds maximum digits")
     if not length_bytes:
         raise ProtocolError("Empty length field")
-    length = int(length_bytes.decode("ascii"))
+    length = int(length_bytes)
     if length > MAX_CONTENT_SIZE:
         raise ProtocolError(f"Content size {length} exceeds limit {MAX_CONTENT_SIZE}")
+    if length < FUSED_READ_THRESHOLD:
+        # Content and comma terminator arrive in a single await
+        frame = await _read_exactly(reader, length + 1, length)
+        content, terminator = frame[:-1], frame[-1:]
+    else:
+        # Return StreamReader's bytes as-is instead of re-slicing a copy
+        content = await _read_exactly(reader, length, length)
+        terminator = await _read_exactly(reader, 1, 0)
+    if terminator != b",":
+        raise ProtocolError(f"Expected comma terminator, got {terminator!r}")
+    return content
+
+
+async def _read_exactly(
+    reader: asyncio.StreamReader, count: int, content_length: int
+) -> bytes:
+    """
+    Read exactly count bytes, mapping EOF to ProtocolError.
+
+    Args:
+        reader: asyncio StreamReader to read from.
+        count: Number of bytes to read.
+        content_length: Content bytes included in count. EOF after at least
+            this many bytes is reported as a missing comma terminator.
+
+    Returns:
+        The bytes read.
+
+    Raises:
+        ProtocolError: If the connection closes before count bytes arrive.
+    """
     try:
-        content = await reader.readexactly(length)
+        return await reader.readexactly(count)
     except asyncio.IncompleteReadError as e:
+        if len(e.partial) >= content_length:
+            raise ProtocolError("Expected comma terminator, got b''") from e
         raise ProtocolError(f"Connection closed after {e.partial!r} bytes") from e
-    comma = await reader.read(1)
-    if comma != b",":
-        raise ProtocolError(f"Expected comma terminator, got {comma!r}")
-    return content
 
 
 # Timeout for goodbye message drain in seconds.
@@ -7,11 +7,13 @@ including resolving selection atoms and shared event-waiting utilities.
 
 from __future__ import annotations
 
-from Xlib import Xatom
+import select
 from time import monotonic as _monotonic
-
 from typing import TYPE_CHECKING
 
+from Xlib import X, Xatom
+from Xlib.ext.xfixes import SetSelectionOwnerNotify
+
 if TYPE_CHECKING:
     from Xlib.display import Display
     from Xlib.protocol.rq import Event
@@ -20,6 +22,12 @@ if TYPE_CHECKING:
 # Timeout for waiting for our own property change (should always succeed quickly)
 TIMESTAMP_TIMEOUT: float = 1.0
 
+# Maximum events handled between deadline checks while draining the queue
+MAX_EVENTS_PER_PASS: int = 64
+
+# PRIMARY is a predefined atom, so it can be bound once at import time
+_PRIMARY_ATOM: int = Xatom.PRIMARY
+
 
 def get_other_selection(selection_atom: int, clipboard_atom: int) -> int:
     """Return the other selection atom.
@@ -35,9 +43,24 @@ def get_other_selection(selection_atom: int, clipboard_atom: int) -> int:
     Returns:
         The atom of the other selection.
     """
-    if selection_atom == clipboard_atom:
-        return Xatom.PRIMARY
-    return clipboard_atom
+    return _PRIMARY_ATOM if selection_atom == clipboard_atom else clipboard_atom
+
+
+def _defer_owner_change(
+    event: "Event",
+    deferred_events: list["Event"],
+    seen: set[tuple[int, object, int]],
+) -> None:
+    """Defer a SetSelectionOwnerNotify unless an identical one was seen.
+
+    Each deferred owner change triggers a clipboard read, so repeats of
+    the same (selection, owner, selection_timestamp) within one wait are
+    dropped.
+    """
+    key = (event.selection, event.owner, event.selection_timestamp)
+    if key not in seen:
+        seen.add(key)
+        deferred_events.append(event)
 
 
 def wait_for_event_type(
@@ -49,10 +72,11 @@ def wait_for_event_type(
     """Poll display for an event of the target type with timeout.
 
     Reads events from the display until an event of target_event_type
-    is found or timeout expires. Uses select() on the display file
-    descriptor to avoid blocking indefinitely. Other events
-    (SelectionRequest, SetSelectionOwnerNotify) are appended to
-    deferred_events for later processing.
+    is found or timeout expires. Uses poll() on the display file
+    descriptor, registered at most once per call, to avoid blocking
+    indefinitely. Other events (SelectionRequest,
+    SetSelectionOwnerNotify) are appended to deferred_events for later
+    processing.
 
     Args:
         display: The X11 display connection.
@@ -63,30 +87,43 @@ def wait_for_event_type(
     Returns:
         The matching event of target_event_type, or None if timeout.
     """
-    import select
-    from Xlib import X
-
     deadline = _monotonic() + timeout
+    poller: select.poll | None = None
+    seen_owner_changes: set[tuple[int, object, int]] = set()
+    count = 0
     while True:
-        # Check for already-buffered events first
-        while display.pending_events() > 0:
+        # Check for already-buffered events first. pending_events() makes a
+        # socket pass, so it is only asked again once every event it last
+        # reported has been consumed; batches are capped so a burst of
+        # other events cannot outrun the deadline
+        if count <= 0:
+            count = display.pending_events()
+        batch = min(count, MAX_EVENTS_PER_PASS)
+        count -= batch
+        for _ in range(batch):
             event = display.next_event()
-            if event.type == target_event_type:
+            event_type = event.type
+            if event_type == target_event_type:
                 return event
             # Defer SelectionRequest and SetSelectionOwnerNotify
-            if event.type == X.SelectionRequest:
-                deferred_events.append(event)
-            elif type(event).__name__ == "SetSelectionOwnerNotify":
+            if event_type == X.SelectionRequest:
                 deferred_events.append(event)
+            elif type(event) is SetSelectionOwnerNotify:
+                _defer_owner_change(event, deferred_events, seen_owner_changes)
 
         # Calculate remaining time
         remaining = deadline - _monotonic()
         if remaining <= 0:
             return None
-
-        # Wait for data with timeout
-        readable, _, _ = select.select([display.fileno()], [], [], remaining)
-        if not readable:
+        if batch > 0:
+            continue
+
+        # Wait for data with timeout (poll takes milliseconds), registering
+        # the display fd once, only if the event was not already queued
+        if poller is None:
+            poller = select.poll()
+            poller.register(display.fileno(), select.POLLIN)
+        if not poller.poll(remaining * 1000):
             return None
 
 
@@ -94,6 +131,7 @@ def get_server_timestamp(
     display: "Display",
     window: "Window",
     deferred_events: list["Event"],
+    prop_atom: int,
 ) -> int | None:
     """Query the X server's current timestamp.
 
@@ -105,14 +143,12 @@ def get_server_timestamp(
         display: The X11 display connection.
         window: The window to change a property on.
         deferred_events: List to collect other events during wait.
+        prop_atom: The cached PCLIPSYNC_TIMESTAMP atom for the dummy property.
 
     Returns:
         The X server's current timestamp, or None if timeout (unexpected).
     """
-    from Xlib import X, Xatom
-
     # Change a dummy property to trigger PropertyNotify
-    prop_atom = display.intern_atom("PCLIPSYNC_TIMESTAMP")
     window.change_property(prop_atom, Xatom.INTEGER, 32, [0])
     display.flush()
 
@@ -135,9 +171,10 @@ def wait_for_property_notify(
     """Wait for PropertyNotify event with matching criteria.
 
     Waits for a PropertyNotify event matching the specified window,
-    property atom, and state=PropertyNewValue. Uses select-based
-    timeout to avoid blocking indefinitely. Defers SelectionRequest
-    and SetSelectionOwnerNotify events for later processing.
+    property atom, and state=PropertyNewValue. Uses poll-based
+    timeout to avoid blocking indefinitely, flushing queued requests
+    before each poll. Defers SelectionRequest and SetSelectionOwnerNotify
+    events for later processing.
 
     Args:
         display: The X11 display connection.
@@ -149,32 +186,51 @@ def wait_for_property_notify(
     Returns:
         The matching PropertyNotify event, or None if timeout.
     """
-    import select
-    from Xlib import X
-
     deadline = _monotonic() + timeout
+    poller: select.poll | None = None
+    seen_owner_changes: set[tuple[int, object, int]] = set()
+    count = 0
     while True:
-        # Check for already-buffered events first
-        while display.pending_events() > 0:
+        # Check for already-buffered events first. pending_events() makes a
+        # socket pass, so it is only asked again once every event it last
+        # reported has been consumed; batches are capped so a burst of
+        # other events cannot outrun the deadline
+        if count <= 0:
+            count = display.pending_events()
+        batch = min(count, MAX_EVENTS_PER_PASS)
+        count -= batch
+        for _ in range(batch):
             event = display.next_event()
-            # Check for matching PropertyNotify
-            if (event.type == X.PropertyNotify and
-                    event.window == window and
+            # Fields are proxied through rq.Event.__getattr__, so read
+            # type once and test the plain int fields before the window,
+            # whose comparison calls back into Python
+            event_type = event.type
+            if (event_type == X.PropertyNotify and
                     event.atom == prop_atom and
-                    event.state == X.PropertyNewValue):
+                    event.state == X.PropertyNewValue and
+                    event.window == window):
                 return event
             # Defer SelectionRequest and SetSelectionOwnerNotify
-            if event.type == X.SelectionRequest:
-                deferred_events.append(event)
-            elif type(event).__name__ == "SetSelectionOwnerNotify":
+            if event_type == X.SelectionRequest:
                 deferred_events.append(event)
+            elif type(event) is SetSelectionOwnerNotify:
+                _defer_owner_change(event, deferred_events, seen_owner_changes)
 
         # Calculate remaining time
         remaining = deadline - _monotonic()
         if remaining <= 0:
             return None
-
-        # Wait for data with timeout
-        readable, _, _ = select.select([display.fileno()], [], [], remaining)
-        if not readable:
+        if batch > 0:
+            continue
+
+        # Send any queued requests (e.g. the INCR property delete) before
+        # blocking; the owner will not write the next chunk until it sees them
+        display.flush()
+
+        # Wait for data with timeout (poll takes milliseconds), registering
+        # the display fd once, only if the event was not already queued
+        if poller is None:
+            poller = select.poll()
+            poller.register(display.fileno(), select.POLLIN)
+        if not poller.poll(remaining * 1000):
             return None
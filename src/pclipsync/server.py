@@ -18,6 +18,17 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import signal
+
+from pclipsync.clipboard import create_hidden_window, validate_display
+from pclipsync.clipboard_events import register_xfixes_events
+from pclipsync.hashing import HashState
+from pclipsync.protocol import STREAM_READER_LIMIT
+from pclipsync.server_handler import handle_client
+from pclipsync.server_socket import check_socket_state, print_startup_message
+from pclipsync.sync import ClipboardState
+
 
 async def run_server(socket_path: str) -> None:
     """Run the server, accepting one client and syncing clipboards.
@@ -30,17 +41,6 @@ async def run_server(socket_path: str) -> None:
     Args:
         socket_path: Path to the Unix domain socket to listen on.
     """
-    import asyncio
-    import signal
-
-    from pclipsync.clipboard import create_hidden_window, validate_display
-    from pclipsync.clipboard_events import register_xfixes_events
-    from pclipsync.hashing import HashState
-    from pclipsync.server_handler import handle_client
-    from pclipsync.server_socket import check_socket_state, print_startup_message
-    from pclipsync.sync import ClipboardState
-
-
     # Initialize X11
     display = validate_display()
     window = create_hidden_window(display)
@@ -55,38 +55,41 @@ async def run_server(socket_path: str) -> None:
         current_content=b"",
         clipboard_atom=clipboard_atom,
         incr_atom=display.intern_atom("INCR"),
+        timestamp_atom=display.intern_atom("PCLIPSYNC_TIMESTAMP"),
     )
 
     # Check and prepare socket
     check_socket_state(socket_path)
     print_startup_message(socket_path)
 
-    # Register signal handlers for clean shutdown
-    shutdown_requested = asyncio.Event()
+    # Signals ask the sync loop to say goodbye and wake us directly, so
+    # a single one-shot future covers both client disconnect and shutdown
+    # requests
     loop = asyncio.get_running_loop()
-    loop.add_signal_handler(signal.SIGINT, shutdown_requested.set)
-    loop.add_signal_handler(signal.SIGTERM, shutdown_requested.set)
+    shutdown_requested = asyncio.Event()
+    shutdown_future: asyncio.Future[None] = loop.create_future()
+
+    def request_shutdown() -> None:
+        shutdown_requested.set()
+        if not shutdown_future.done():
+            shutdown_future.set_result(None)
+
+    loop.add_signal_handler(signal.SIGINT, request_shutdown)
+    loop.add_signal_handler(signal.SIGTERM, request_shutdown)
 
     # Create exception holder for client handler
     exception_holder: list[Exception] = []
 
     # Start server and accept one client
-    shutdown_event = asyncio.Event()
     server = await asyncio.start_unix_server(
-        lambda r, w: handle_client(state, r, w, shutdown_event, shutdown_requested, exception_holder),
+        lambda r, w: handle_client(state, r, w, shutdown_future, shutdown_requested, exception_holder),
         path=socket_path,
+        limit=STREAM_READER_LIMIT,
     )
 
     async with server:
         # Wait for either client disconnect or signal
-        shutdown_event_task = asyncio.create_task(shutdown_event.wait())
-        shutdown_requested_task = asyncio.create_task(shutdown_requested.wait())
-        done, pending = await asyncio.wait(
-            [shutdown_event_task, shutdown_requested_task],
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-        for task in pending:
-            task.cancel()
+        await shutdown_future
 
         # Propagate any exception from client handler
         if exception_holder:
@@ -8,19 +8,25 @@ the synchronization loop and manages the connection lifecycle.
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
+from pclipsync.protocol import ProtocolError, configure_stream_writer
+from pclipsync.sync import run_sync_loop
+
 if TYPE_CHECKING:
     import asyncio
 
     from pclipsync.sync_state import ClipboardState
 
+logger = logging.getLogger(__name__)
+
 
 async def handle_client(
     state: ClipboardState,
     reader: asyncio.StreamReader,
     writer: asyncio.StreamWriter,
-    shutdown_event: asyncio.Event,
+    shutdown_future: asyncio.Future[None],
     shutdown_requested: asyncio.Event,
     exception_holder: list[Exception],
 ) -> None:
@@ -34,17 +40,12 @@ async def handle_client(
         state: The clipboard synchronization state.
         reader: The asyncio StreamReader for the socket connection.
         writer: The asyncio StreamWriter for the socket connection.
-        shutdown_event: Event to set when client disconnects.
+        shutdown_future: Future to resolve when client disconnects.
         shutdown_requested: Event signaling graceful shutdown request.
         exception_holder: List to store exceptions for propagation.
     """
-    import logging
-
-    from pclipsync.protocol import ProtocolError
-    from pclipsync.sync import run_sync_loop
-
-    logger = logging.getLogger(__name__)
     logger.debug("Client connected")
+    configure_stream_writer(writer)
 
     try:
         await run_sync_loop(state, reader, writer, shutdown_requested)
@@ -58,4 +59,5 @@ async def handle_client(
     finally:
         writer.close()
         await writer.wait_closed()
-        shutdown_event.set()
+        if not shutdown_future.done():
+            shutdown_future.set_result(None)
@@ -10,6 +10,7 @@ used by the server, including:
 
 from __future__ import annotations
 
+import errno
 import os
 import socket
 import sys
@@ -31,23 +32,28 @@ def check_socket_state(socket_path: str) -> None:
     if not os.path.exists(socket_path):
         return
 
-    # Try to connect to check if socket is active
-    test_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Try to connect to check if socket is active; connect_ex reports
+    # connection failures as an errno but still raises for address-level
+    # ones such as an over-long AF_UNIX path
     try:
-        test_socket.connect(socket_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as test_socket:
+            err = test_socket.connect_ex(socket_path)
+    except OSError as e:
+        print(f"Error: Cannot access socket {socket_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if err == 0:
         # Connection succeeded - active server exists
-        test_socket.close()
         print(f"Error: Socket already in use by active server: {socket_path}",
             file=sys.stderr)
         sys.exit(1)
-    except ConnectionRefusedError:
+    if err == errno.ECONNREFUSED:
         # Stale socket - unlink and proceed
         os.unlink(socket_path)
-    except OSError as e:
-        print(f"Error: Cannot access socket {socket_path}: {e}", file=sys.stderr)
-        sys.exit(1)
-    finally:
-        test_socket.close()
+        return
+    print(f"Error: Cannot access socket {socket_path}: {os.strerror(err)}",
+        file=sys.stderr)
+    sys.exit(1)
 
 
 def print_startup_message(socket_path: str) -> None:
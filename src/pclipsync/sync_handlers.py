@@ -14,10 +14,10 @@ from typing import TYPE_CHECKING
 
 from Xlib import Xatom
 
-from pclipsync.clipboard_events import set_clipboard_content
+from pclipsync.clipboard_events import set_clipboard_content, set_clipboard_content_many
 from pclipsync.clipboard_io import read_clipboard_content
 from pclipsync.hashing import compute_hash
-from pclipsync.protocol import encode_netstring, validate_content_size
+from pclipsync.protocol import validate_content_size, write_netstring
 from pclipsync.selection_utils import get_other_selection, get_server_timestamp
 
 if TYPE_CHECKING:
@@ -67,22 +67,23 @@ async def handle_clipboard_change(
     if set_clipboard_content(state.display, state.window, content, other_atom):
         state.owned_selections.add(other_atom)
         state.acquisition_time = get_server_timestamp(
-            state.display, state.window, state.deferred_events
+            state.display, state.window, state.deferred_events,
+            state.timestamp_atom,
         )
     else:
         logger.warning("Failed to mirror to other selection, continuing")
     current_hash = compute_hash(content)
     if not state.hash_state.should_send(current_hash):
-        sent = state.hash_state.last_sent_hash
-        recv = state.hash_state.last_received_hash
-        logger.debug(
-            "Skipping duplicate or echo: hash=%s sent=%s recv=%s",
-            current_hash[:16], sent[:16] if sent else None, recv[:16] if recv else None)
+        if logger.isEnabledFor(logging.DEBUG):
+            sent = state.hash_state.last_sent_hash
+            recv = state.hash_state.last_received_hash
+            logger.debug(
+                "Skipping duplicate or echo: hash=%s sent=%s recv=%s",
+                current_hash.hex(), sent.hex() if sent else None,
+                recv.hex() if recv else None)
         return
 
-    encoded = encode_netstring(content)
-    writer.write(encoded)
-    await writer.drain()
+    await write_netstring(writer, content)
     state.hash_state.record_sent(current_hash)
     logger.debug("Sent %d bytes to remote", len(content))
 
@@ -112,20 +113,21 @@ async def handle_incoming_content(
     clipboard_atom = state.clipboard_atom
     primary_atom = Xatom.PRIMARY
 
-    # Set both CLIPBOARD and PRIMARY selections
-    if set_clipboard_content(state.display, state.window, content, clipboard_atom):
-        state.owned_selections.add(clipboard_atom)
-    else:
+    # Set both CLIPBOARD and PRIMARY selections in one batch
+    acquired = set_clipboard_content_many(
+        state.display, state.window, (clipboard_atom, primary_atom)
+    )
+    state.owned_selections.update(acquired)
+    if clipboard_atom not in acquired:
         logger.error("Failed to set CLIPBOARD selection")
-    if set_clipboard_content(state.display, state.window, content, primary_atom):
-        state.owned_selections.add(primary_atom)
-    else:
+    if primary_atom not in acquired:
         logger.error("Failed to set PRIMARY selection")
 
     # Set acquisition_time if we own at least one selection
     if state.owned_selections:
         state.acquisition_time = get_server_timestamp(
-            state.display, state.window, state.deferred_events
+            state.display, state.window, state.deferred_events,
+            state.timestamp_atom,
         )
 
     logger.debug("Received and set %d bytes from remote", len(content))
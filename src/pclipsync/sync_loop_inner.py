@@ -13,6 +13,7 @@ from contextlib import suppress
 from typing import TYPE_CHECKING, cast
 
 from Xlib import X
+from Xlib.ext.xfixes import SetSelectionOwnerNotify
 
 from pclipsync.clipboard_selection import (cleanup_incr_sends_on_ownership_loss, handle_selection_request, process_pending_events)
 from pclipsync.protocol import read_netstring, send_goodbye, is_goodbye
@@ -43,24 +44,24 @@ async def sync_loop_inner(
     """
     read_task = asyncio.create_task(read_netstring(reader))
     shutdown_task = asyncio.create_task(shutdown_requested.wait())
+    # Each waiter task lives until it completes, so a wakeup from one
+    # source does not tear down and rebuild the others
+    x11_task = asyncio.create_task(state.x11_event.wait())
     try:
         while True:
             # Wait for either X11 event or network data
-            x11_task = asyncio.create_task(state.x11_event.wait())
-
             done, pending = await asyncio.wait(
                 {read_task, x11_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED
             )
 
-            # Only cancel x11_task - it's stateless (Event.wait)
-            # Never cancel read_task - it would corrupt StreamReader buffer
-            with suppress(asyncio.CancelledError):
-                x11_task.cancel()
-                await x11_task
-
             if x11_task in done:
                 state.x11_event.clear()
                 await process_x11_events(state, writer)
+                # Events Xlib read off the socket while we awaited (e.g.
+                # alongside a reply) leave the fd idle, so wake for them now
+                if state.display.pending_events() > 0:
+                    state.x11_event.set()
+                x11_task = asyncio.create_task(state.x11_event.wait())
 
             if read_task in done:
                 content = read_task.result()
@@ -75,10 +76,14 @@ async def sync_loop_inner(
                 return
 
     finally:
-        # Clean up read_task on loop exit
+        # Clean up waiter tasks on loop exit. read_task is only cancelled
+        # here: cancelling it mid-loop would corrupt the StreamReader buffer
         read_task.cancel()
         with suppress(asyncio.CancelledError):
             await read_task
+        x11_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await x11_task
         shutdown_task.cancel()
         with suppress(asyncio.CancelledError):
             await shutdown_task
@@ -107,22 +112,26 @@ async def process_x11_events(
                 state.pending_incr_sends,
                 state.incr_atom,
             )
-        elif type(event).__name__ == "SetSelectionOwnerNotify":
+        elif type(event) is SetSelectionOwnerNotify:
             # XFixes SetSelectionOwnerNotify event - track ownership loss
-            logging.debug("SetSelectionOwnerNotify: selection=%s owner=%s us=%s",
-                event.selection, event.owner.id, state.window.id)
-            if event.owner.id != state.window.id:
-                # We lost ownership of this selection
-                state.owned_selections.discard(event.selection)
-                # Clean up pending INCR sends for this selection
-                cleanup_incr_sends_on_ownership_loss(
-                    state.display, event.selection, state.pending_incr_sends
-                )
-                # Clear received hash: content from another app is not echo
-                state.hash_state.clear_received_hash()
-                # Clear sent hash: content from another app is not duplicate
-                state.hash_state.clear_sent_hash()
-                # Clear acquisition_time only when we own no selections
-                if not state.owned_selections:
-                    state.acquisition_time = None
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("SetSelectionOwnerNotify: selection=%s owner=%s us=%s",
+                    event.selection, event.owner.id, state.window.id)
+            if event.owner.id == state.window.id:
+                # We took ownership ourselves (remote content or mirroring),
+                # so there is nothing to read back; skip the owner query
+                continue
+            # We lost ownership of this selection
+            state.owned_selections.discard(event.selection)
+            # Clean up pending INCR sends for this selection
+            cleanup_incr_sends_on_ownership_loss(
+                state.display, event.selection, state.pending_incr_sends
+            )
+            # Clear received hash: content from another app is not echo
+            state.hash_state.clear_received_hash()
+            # Clear sent hash: content from another app is not duplicate
+            state.hash_state.clear_sent_hash()
+            # Clear acquisition_time only when we own no selections
+            if not state.owned_selections:
+                state.acquisition_time = None
             await handle_clipboard_change(state, writer, event.selection)
@@ -21,7 +21,7 @@ if TYPE_CHECKING:
     from pclipsync.clipboard_selection import IncrSendState
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipboardState:
     """State for clipboard synchronization.
 
@@ -43,6 +43,8 @@ class ClipboardState:
         incr_atom: Cached INCR atom for incremental transfer detection.
         pending_incr_sends: Dict mapping (requestor_id, property_atom) to
             IncrSendState for tracking in-progress INCR send transfers.
+        timestamp_atom: Cached PCLIPSYNC_TIMESTAMP atom used to query the
+            X server time without an intern_atom round-trip.
     """
 
     display: Display
@@ -58,3 +60,4 @@ class ClipboardState:
     pending_incr_sends: dict[tuple[int, int], IncrSendState] = field(
         default_factory=dict
     )
+    timestamp_atom: int = 0
@@ -7,15 +7,21 @@ and hash state initialization.
 
 import asyncio
 import os
+import shutil
+import socket
 import subprocess
-import tempfile
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from pclipsync.hashing import HashState
+from pclipsync.protocol import STREAM_READER_LIMIT
+from pclipsync.sync_state import ClipboardState
 
 
 def has_display() -> bool:
@@ -45,15 +51,54 @@ def mock_clipboard_state() -> MagicMock:
     return state
 
 
+@pytest.fixture
+def mock_state() -> ClipboardState:
+    """Create a real ClipboardState around mock X11 handles."""
+    return ClipboardState(display=MagicMock(), window=MagicMock())
+
+
 @pytest.fixture
 def mock_writer() -> AsyncMock:
     """Create a mock StreamWriter for testing."""
     writer = AsyncMock()
     writer.write = MagicMock()
+    writer.writelines = MagicMock()
     writer.drain = AsyncMock()
+    writer.close = MagicMock()
+    writer.wait_closed = AsyncMock()
+    writer.transport = MagicMock()
+    writer.get_extra_info = MagicMock(return_value=None)
     return writer
 
 
+@pytest.fixture
+def mock_shutdown_future() -> MagicMock:
+    """Create a mock unresolved shutdown future."""
+    future = MagicMock()
+    future.done.return_value = False
+    return future
+
+
+@pytest.fixture
+async def stream_pair() -> AsyncGenerator[
+    tuple[asyncio.StreamReader, asyncio.StreamWriter], None
+]:
+    """Connect two asyncio streams over an in-process Unix socketpair.
+
+    Yields the reading end's StreamReader and the writing end's
+    StreamWriter, with no filesystem socket to bind or clean up.
+    """
+    sock_a, sock_b = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    reader, reader_side_writer = await asyncio.open_unix_connection(
+        sock=sock_a, limit=STREAM_READER_LIMIT
+    )
+    _, writer = await asyncio.open_unix_connection(sock=sock_b)
+    yield reader, writer
+    for w in (writer, reader_side_writer):
+        w.close()
+        await w.wait_closed()
+
+
 @pytest.fixture
 def temp_socket_path(tmp_path: Path) -> Generator[Path, None, None]:
     """Provide a temporary path for Unix domain socket testing."""
@@ -63,38 +108,34 @@ def temp_socket_path(tmp_path: Path) -> Generator[Path, None, None]:
         socket_path.unlink()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xvfb_display() -> Generator[str | None, None, None]:
     """Start Xvfb virtual display if available, yield DISPLAY string.
     
-    Returns None if Xvfb is not available. Tests using this fixture
-    should skip if the value is None.
+    Session-scoped so one server is shared by every X11 test. Returns
+    None if Xvfb is not available. Tests using this fixture should skip
+    if the value is None.
     """
-    try:
-        result = subprocess.run(
-            ["which", "Xvfb"],
-            capture_output=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            yield None
-            return
-    except FileNotFoundError:
+    if shutil.which("Xvfb") is None:
         yield None
         return
     
     display_num = 99
     display = f":{display_num}"
+    socket_path = Path(f"/tmp/.X11-unix/X{display_num}")
     proc = subprocess.Popen(
         ["Xvfb", display, "-screen", "0", "1024x768x24"],
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
     try:
-        import time
-        
-        time.sleep(0.5)
-        if proc.poll() is not None:
+        # Poll for the server's listening socket instead of a fixed sleep
+        deadline = time.monotonic() + 2.0
+        while not socket_path.exists() and proc.poll() is None:
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(0.01)
+        if proc.poll() is not None or not socket_path.exists():
             yield None
             return
         old_display = os.environ.get("DISPLAY")
@@ -107,3 +148,43 @@ def xvfb_display() -> Generator[str | None, None, None]:
     finally:
         proc.terminate()
         proc.wait()
+
+
+@pytest.fixture(scope="session")
+def x_display() -> Generator[Any, None, None]:
+    """Open one real X11 display connection shared by the whole session.
+
+    Skips the requesting test when no display is available.
+    """
+    if not has_display():
+        pytest.skip("No X11 display available")
+    from Xlib.display import Display
+
+    display = Display()
+    yield display
+    display.close()
+
+
+@pytest.fixture
+def patched_incr(monkeypatch: pytest.MonkeyPatch) -> Callable[[Any, Any], None]:
+    """Install stubs for the INCR wait and chunk-read helpers.
+
+    Returns a function taking the wait_for_property_notify and
+    _read_chunk_property replacements; monkeypatch restores both.
+    """
+    import pclipsync.clipboard_io as clipboard_io
+    import pclipsync.selection_utils as selection_utils
+
+    def install(wait: Any, read: Any) -> None:
+        monkeypatch.setattr(selection_utils, "wait_for_property_notify", wait)
+        monkeypatch.setattr(clipboard_io, "_read_chunk_property", read)
+
+    return install
+
+
+@pytest.fixture
+def incr_mocks() -> SimpleNamespace:
+    """Build fresh INCR display, window and event mocks for each test."""
+    return SimpleNamespace(
+        display=MagicMock(), window=MagicMock(), event=MagicMock()
+    )
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Lightweight X11 display stand-in for event-loop tests."""
+from collections.abc import Iterable
+from typing import Any
+
+
+class FakeDisplay:
+    """Display double that replays scripted pending counts and events.
+
+    Covers only what the selection wait loops call, without the attribute
+    machinery of MagicMock. Running past either script raises
+    StopIteration, which surfaces unexpected extra calls, and
+    assert_consumed() catches scripted calls that never happened.
+    """
+
+    def __init__(self, events: Iterable[Any], pending: Iterable[int]) -> None:
+        self._events = iter(events)
+        self._pending = iter(pending)
+
+    def pending_events(self) -> int:
+        """Return the next scripted pending-event count."""
+        return next(self._pending)
+
+    def next_event(self) -> Any:
+        """Return the next scripted event."""
+        return next(self._events)
+
+    def flush(self) -> None:
+        """Do nothing; there is no socket to write to."""
+
+    def assert_consumed(self) -> None:
+        """Assert that both scripts were used up."""
+        assert next(self._events, None) is None
+        assert next(self._pending, None) is None
+
+    def fileno(self) -> int:
+        """Return an invalid descriptor; scripted tests never poll."""
+        return -1
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Helper functions for building X11 event objects in tests."""
+from typing import Any
+
+from Xlib.ext.xfixes import SetSelectionOwnerNotify
+
+
+def make_owner_notify(**fields: Any) -> SetSelectionOwnerNotify:
+    """Create a SetSelectionOwnerNotify event with the given fields.
+
+    The event is built without parsing wire data so fields can hold mocks,
+    while type(event) is still the real XFixes event class. Fields not
+    given default to CLIPBOARD with no owner at time zero.
+    """
+    event = SetSelectionOwnerNotify.__new__(SetSelectionOwnerNotify)
+    event._data = {
+        "selection": 1,
+        "owner": 0,
+        "timestamp": 0,
+        "selection_timestamp": 0,
+        **fields,
+    }
+    return event
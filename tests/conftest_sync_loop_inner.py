@@ -2,14 +2,18 @@
 """Helper functions for sync_loop_inner tests."""
 from unittest.mock import MagicMock
 
+from Xlib.ext.xfixes import SetSelectionOwnerNotify
 
-def make_owner_event(owner_id: int, timestamp: int) -> MagicMock:
-    """Create a mock SetSelectionOwnerNotify event."""
-    event = MagicMock()
-    # Make type(event).__name__ return "SetSelectionOwnerNotify"
-    event.__class__.__name__ = "SetSelectionOwnerNotify"
-    event.owner = MagicMock()
-    event.owner.id = owner_id
-    event.timestamp = timestamp
-    event.selection = 1  # CLIPBOARD atom
-    return event
+from conftest_events import make_owner_notify
+
+
+def make_owner_event(owner_id: int, timestamp: int) -> SetSelectionOwnerNotify:
+    """Create a SetSelectionOwnerNotify event."""
+    owner = MagicMock()
+    owner.id = owner_id
+    return make_owner_notify(
+        type=999,
+        owner=owner,
+        timestamp=timestamp,
+        selection=1,  # CLIPBOARD atom
+    )
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Tests for client connection functions."""
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,17 +9,22 @@ import pytest
 async def test_connect_to_server_success() -> None:
     """Test connect_to_server returns reader/writer on success."""
     from pclipsync.client_retry import connect_to_server
+    from pclipsync.protocol import STREAM_READER_LIMIT
 
     mock_reader = AsyncMock()
-    mock_writer = AsyncMock()
+    mock_writer = MagicMock()
+    mock_writer.get_extra_info.return_value = None
 
     with patch("asyncio.open_unix_connection", new_callable=AsyncMock) as mock_open:
         mock_open.return_value = (mock_reader, mock_writer)
         reader, writer = await connect_to_server("/tmp/test.sock")
 
-        mock_open.assert_called_once_with("/tmp/test.sock")
+        mock_open.assert_called_once_with(
+            "/tmp/test.sock", limit=STREAM_READER_LIMIT
+        )
         assert reader is mock_reader
         assert writer is mock_writer
+        mock_writer.transport.set_write_buffer_limits.assert_called_once_with(high=0)
 
 
 @pytest.mark.asyncio
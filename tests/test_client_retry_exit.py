@@ -5,25 +5,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import asyncio
 
-from pclipsync.hashing import HashState
 from pclipsync.sync_state import ClipboardState
 
 
-@pytest.fixture
-def mock_state() -> MagicMock:
-    """Create a mock ClipboardState with real HashState."""
-    state = MagicMock(spec=ClipboardState)
-    state.hash_state = HashState()
-    state.display = MagicMock()
-    state.window = MagicMock()
-    state.current_content = b""
-    state.pending_incr_sends = {}
-    return state
-
-
 @pytest.mark.asyncio
 async def test_run_client_connection_exits_1_on_protocol_error(
-    mock_state: MagicMock
+    mock_state: ClipboardState
 ) -> None:
     """Test run_client_connection exits with code 1 on ProtocolError."""
     from pclipsync.client_retry import run_client_connection
@@ -48,7 +35,7 @@ async def test_run_client_connection_exits_1_on_protocol_error(
 
 @pytest.mark.asyncio
 async def test_run_client_connection_exits_1_on_connection_error(
-    mock_state: MagicMock
+    mock_state: ClipboardState
 ) -> None:
     """Test run_client_connection exits with code 1 on ConnectionError."""
     from pclipsync.client_retry import run_client_connection
@@ -72,7 +59,7 @@ async def test_run_client_connection_exits_1_on_connection_error(
 
 @pytest.mark.asyncio
 async def test_run_client_connection_exits_cleanly_on_goodbye(
-    mock_state: MagicMock
+    mock_state: ClipboardState
 ) -> None:
     """Test run_client_connection exits cleanly when goodbye received."""
     from pclipsync.client_retry import run_client_connection
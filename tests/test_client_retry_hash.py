@@ -5,30 +5,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import asyncio
 
-from pclipsync.hashing import HashState
 from pclipsync.sync_state import ClipboardState
 
 
-@pytest.fixture
-def mock_state() -> MagicMock:
-    """Create a mock ClipboardState with real HashState."""
-    state = MagicMock(spec=ClipboardState)
-    state.hash_state = HashState()
-    state.display = MagicMock()
-    state.window = MagicMock()
-    state.current_content = b""
-    state.pending_incr_sends = {}
-    return state
-
-
 @pytest.mark.asyncio
-async def test_run_client_connection_clears_hash_state(mock_state: MagicMock) -> None:
+async def test_run_client_connection_clears_hash_state(mock_state: ClipboardState) -> None:
     """Test hash state is cleared on each connection attempt."""
     from pclipsync.client_retry import run_client_connection
 
     # Set up hash state with some values
-    mock_state.hash_state.record_sent("abc123")
-    mock_state.hash_state.record_received("def456")
+    mock_state.hash_state.record_sent(b"abc123")
+    mock_state.hash_state.record_received(b"def456")
 
     assert mock_state.hash_state.last_sent_hash is not None
     assert mock_state.hash_state.last_received_hash is not None
@@ -3,37 +3,93 @@
 Tests for set_clipboard_content and process_pending_events.
 """
 
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from Xlib.error import ConnectionClosedError
 
-from conftest import has_display
+from pclipsync.clipboard_events import (
+    set_clipboard_content,
+    set_clipboard_content_many,
+)
+from pclipsync.clipboard_selection import process_pending_events
 
 
 class TestSetClipboardContent:
     """Tests for set_clipboard_content function."""
 
-    def test_successful_ownership(self) -> None:
-        """Return True when ownership acquired."""
-        from pclipsync.clipboard_events import set_clipboard_content
-        mock_display = MagicMock()
-        mock_window = MagicMock()
-        mock_display.get_selection_owner.return_value = mock_window
+    @pytest.mark.parametrize(
+        ("owner_matches", "expected"),
+        [(True, True), (False, False)],
+        ids=["acquired", "not_acquired"],
+    )
+    def test_ownership(self, owner_matches: bool, expected: bool) -> None:
+        """Return whether ownership of the selection was acquired."""
+        mock_window = SimpleNamespace(set_selection_owner=lambda *_: None)
+        owner = mock_window if owner_matches else SimpleNamespace()
+        mock_display = SimpleNamespace(
+            flush=lambda: None, get_selection_owner=lambda _: owner
+        )
         result = set_clipboard_content(
             mock_display, mock_window, b"content", 1
         )
-        assert result is True
+        assert result is expected
+
 
-    def test_failed_ownership(self) -> None:
-        """Return False when ownership not acquired."""
-        from pclipsync.clipboard_events import set_clipboard_content
+class TestSetClipboardContentMany:
+    """Tests for set_clipboard_content_many function."""
+
+    def test_queues_all_owners_before_verifying(self) -> None:
+        """Request every selection before the first ownership query."""
         mock_display = MagicMock()
         mock_window = MagicMock()
-        mock_display.get_selection_owner.return_value = MagicMock()
-        result = set_clipboard_content(
-            mock_display, mock_window, b"content", 1
-        )
-        assert result is False
+        calls: list[str] = []
+        mock_window.set_selection_owner.side_effect = lambda *a: calls.append("set")
+
+        def owner(atom: int) -> MagicMock:
+            calls.append("get")
+            return mock_window
+
+        mock_display.get_selection_owner.side_effect = owner
+        result = set_clipboard_content_many(mock_display, mock_window, (1, 2))
+        assert result == [1, 2]
+        assert calls == ["set", "set", "get", "get"]
+
+    def test_returns_only_acquired_selections(self) -> None:
+        """Omit selections another client still owns."""
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        mock_display.get_selection_owner.side_effect = [MagicMock(), mock_window]
+        result = set_clipboard_content_many(mock_display, mock_window, (1, 2))
+        assert result == [2]
+
+    def test_returns_empty_on_error(self) -> None:
+        """Return no selections when the X request fails."""
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        mock_window.set_selection_owner.side_effect = ConnectionClosedError("gone")
+        result = set_clipboard_content_many(mock_display, mock_window, (1, 2))
+        assert result == []
+
+    def test_propagates_unexpected_errors(self) -> None:
+        """Let errors other than X failures reach the caller."""
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        mock_window.set_selection_owner.side_effect = RuntimeError("bug")
+        with pytest.raises(RuntimeError):
+            set_clipboard_content_many(mock_display, mock_window, (1, 2))
+
+    def test_keeps_verified_selections_on_error(self) -> None:
+        """Return selections verified before an X error."""
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        mock_display.get_selection_owner.side_effect = [
+            mock_window, ConnectionClosedError("gone")
+        ]
+        result = set_clipboard_content_many(mock_display, mock_window, (1, 2))
+        assert result == [1]
 
 
 class TestProcessPendingEvents:
@@ -41,22 +97,12 @@ class TestProcessPendingEvents:
 
     def test_returns_empty_when_no_events(self) -> None:
         """Return empty list when no pending events."""
-        from pclipsync.clipboard_selection import process_pending_events
         mock_display = MagicMock()
         mock_display.pending_events.return_value = 0
         result = process_pending_events(mock_display)
         assert result == []
 
-    @pytest.mark.skipif(not has_display(), reason="No X11 display available")
-    def test_collects_selection_request_events(self) -> None:
+    def test_collects_selection_request_events(self, x_display: Any) -> None:
         """Collect SelectionRequest events from real X11 display."""
-        from Xlib.display import Display
-
-        from pclipsync.clipboard_selection import process_pending_events
-
-        display = Display()
-        try:
-            result = process_pending_events(display)
-            assert isinstance(result, list)
-        finally:
-            display.close()
+        result = process_pending_events(x_display)
+        assert isinstance(result, list)
@@ -3,11 +3,12 @@
 Tests for get_display_fd, create_hidden_window, and register_xfixes_events.
 """
 
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock
 
-import pytest
-
-from conftest import has_display
+from pclipsync.clipboard import create_hidden_window, get_display_fd
+from pclipsync.clipboard_events import register_xfixes_events
 
 
 class TestGetDisplayFd:
@@ -15,9 +16,7 @@ class TestGetDisplayFd:
 
     def test_returns_file_descriptor(self) -> None:
         """Return file descriptor from display."""
-        from pclipsync.clipboard import get_display_fd
-        mock_display = MagicMock()
-        mock_display.fileno.return_value = 42
+        mock_display = SimpleNamespace(fileno=lambda: 42)
         result = get_display_fd(mock_display)
         assert result == 42
 
@@ -27,7 +26,6 @@ class TestCreateHiddenWindow:
 
     def test_creates_window(self) -> None:
         """Create a 1x1 window."""
-        from pclipsync.clipboard import create_hidden_window
         mock_display = MagicMock()
         mock_window = MagicMock()
         mock_display.screen().root.create_window.return_value = mock_window
@@ -38,18 +36,12 @@ class TestCreateHiddenWindow:
 class TestRegisterXfixesEvents:
     """Tests for register_xfixes_events function."""
 
-    @pytest.mark.skipif(not has_display(), reason="No X11 display available")
-    def test_registers_for_both_selections(self) -> None:
+    def test_registers_for_both_selections(self, x_display: Any) -> None:
         """Register for CLIPBOARD and PRIMARY selection events."""
-        from Xlib.display import Display
-
-        from pclipsync.clipboard import create_hidden_window
-        from pclipsync.clipboard_events import register_xfixes_events
-
-        display = Display()
+        window = create_hidden_window(x_display)
         try:
-            window = create_hidden_window(display)
-            clipboard_atom = display.intern_atom("CLIPBOARD")
-            register_xfixes_events(display, window, clipboard_atom)
+            clipboard_atom = x_display.intern_atom("CLIPBOARD")
+            register_xfixes_events(x_display, window, clipboard_atom)
         finally:
-            display.close()
+            window.destroy()
+            x_display.flush()
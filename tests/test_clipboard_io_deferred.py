@@ -2,19 +2,19 @@
 """Tests for deferred event collection during _wait_for_selection polling."""
 from unittest.mock import MagicMock
 
-import pytest
-
 from Xlib import X
 
+from conftest_display import FakeDisplay
+from conftest_events import make_owner_notify
+
+from pclipsync.clipboard_io import _wait_for_selection
+
 
 class TestWaitForSelectionDeferredEvents:
     """Tests for event deferral during _wait_for_selection polling."""
 
     def test_defers_selection_request_events(self) -> None:
         """SelectionRequest events are added to deferred_events during polling."""
-        from pclipsync.clipboard_io import _wait_for_selection
-
-        mock_display = MagicMock()
         mock_window = MagicMock()
         prop_atom = 123
 
@@ -24,8 +24,7 @@ class TestWaitForSelectionDeferredEvents:
         sel_notify = MagicMock()
         sel_notify.type = X.SelectionNotify
 
-        mock_display.pending_events.side_effect = [1, 1, 0]
-        mock_display.next_event.side_effect = [sel_request, sel_notify]
+        mock_display = FakeDisplay([sel_request, sel_notify], [1, 1])
 
         mock_prop = MagicMock()
         mock_prop.value = b"test content"
@@ -40,24 +39,19 @@ class TestWaitForSelectionDeferredEvents:
 
         assert len(deferred_events) == 1
         assert deferred_events[0] is sel_request
+        mock_display.assert_consumed()
 
     def test_defers_owner_notify_events(self) -> None:
         """SetSelectionOwnerNotify events are added to deferred_events."""
-        from pclipsync.clipboard_io import _wait_for_selection
-
-        mock_display = MagicMock()
         mock_window = MagicMock()
         prop_atom = 123
 
-        owner_event = MagicMock()
-        owner_event.type = 999
-        owner_event.__class__.__name__ = "SetSelectionOwnerNotify"
+        owner_event = make_owner_notify(type=999)
 
         sel_notify = MagicMock()
         sel_notify.type = X.SelectionNotify
 
-        mock_display.pending_events.side_effect = [1, 1, 0]
-        mock_display.next_event.side_effect = [owner_event, sel_notify]
+        mock_display = FakeDisplay([owner_event, sel_notify], [1, 1])
 
         mock_prop = MagicMock()
         mock_prop.value = b"test"
@@ -72,3 +66,4 @@ class TestWaitForSelectionDeferredEvents:
 
         assert len(deferred_events) == 1
         assert deferred_events[0] is owner_event
+        mock_display.assert_consumed()
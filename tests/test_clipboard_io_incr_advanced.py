@@ -1,46 +1,47 @@
 #!/usr/bin/env python3
 """Tests for _handle_incr_transfer - advanced cases and INCR integration."""
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
-import pytest
+from pclipsync.clipboard_io import _handle_incr_transfer
+from pclipsync.protocol import MAX_CONTENT_SIZE
 
-
-def make_incr_mocks():
-    """Create standard mock objects for INCR transfer tests."""
-    mock_display = MagicMock()
-    mock_window = MagicMock()
-    return mock_display, mock_window
+# Two of these overflow MAX_CONTENT_SIZE; built once since bytes are immutable
+_LARGE_CHUNK = b"x" * ((MAX_CONTENT_SIZE // 2) + 1)
 
 
 class TestHandleIncrTransferAdvanced:
     """Advanced tests for _handle_incr_transfer function."""
 
-    def test_exceeds_max_content_size(self) -> None:
+    def test_exceeds_max_content_size(
+        self,
+        incr_mocks: SimpleNamespace,
+        patched_incr: Callable[[Any, Any], None],
+    ) -> None:
         """INCR transfer exceeding MAX_CONTENT_SIZE returns None."""
-        from pclipsync.clipboard_io import _handle_incr_transfer
-        from pclipsync.protocol import MAX_CONTENT_SIZE
-
-        mock_display, mock_window = make_incr_mocks()
-        mock_event = MagicMock()
+        mock_display, mock_window = incr_mocks.display, incr_mocks.window
+        mock_event = incr_mocks.event
         deferred: list = []
 
-        chunk_size = (MAX_CONTENT_SIZE // 2) + 1
-        large_chunk = b"x" * chunk_size
-        chunks = [large_chunk, large_chunk]
+        chunks = (_LARGE_CHUNK, _LARGE_CHUNK)
 
-        wait_patch = patch("pclipsync.selection_utils.wait_for_property_notify", return_value=mock_event)
-        read_patch = patch("pclipsync.clipboard_io._read_chunk_property", side_effect=chunks)
-        with wait_patch, read_patch:
-            result = _handle_incr_transfer(mock_display, mock_window, 123, deferred, 5.0)
+        mock_wait = MagicMock(return_value=mock_event)
+        mock_read = MagicMock(side_effect=iter(chunks))
+        patched_incr(mock_wait, mock_read)
+        result = _handle_incr_transfer(mock_display, mock_window, 123, deferred, 5.0)
 
         assert result is None
 
-    def test_deferred_events_accumulate_selection_requests(self) -> None:
+    def test_deferred_events_accumulate_selection_requests(
+        self,
+        incr_mocks: SimpleNamespace,
+        patched_incr: Callable[[Any, Any], None],
+    ) -> None:
         """INCR transfer defers SelectionRequest events to deferred_events list."""
-        from pclipsync.clipboard_io import _handle_incr_transfer
-
-        mock_display, mock_window = make_incr_mocks()
-        mock_event = MagicMock()
+        mock_display, mock_window = incr_mocks.display, incr_mocks.window
+        mock_event = incr_mocks.event
         deferred: list = []
 
         mock_sel_req = MagicMock()
@@ -50,11 +51,11 @@ class TestHandleIncrTransferAdvanced:
             args[3].append(mock_sel_req)
             return mock_event
 
-        chunks = [b"data", b""]
-        wait_patch = patch("pclipsync.selection_utils.wait_for_property_notify", side_effect=wait_side_effect)
-        read_patch = patch("pclipsync.clipboard_io._read_chunk_property", side_effect=chunks)
-        with wait_patch, read_patch:
-            result = _handle_incr_transfer(mock_display, mock_window, 123, deferred, 5.0)
+        chunks = (b"data", b"")
+        mock_wait = MagicMock(side_effect=wait_side_effect)
+        mock_read = MagicMock(side_effect=iter(chunks))
+        patched_incr(mock_wait, mock_read)
+        result = _handle_incr_transfer(mock_display, mock_window, 123, deferred, 5.0)
 
         assert result == b"data"
         assert len(deferred) == 2
@@ -1,45 +1,47 @@
 #!/usr/bin/env python3
 """Tests for PropertyReadResult dataclass behavior."""
-import pytest
-
-
-class TestPropertyReadResult:
-    """Tests for PropertyReadResult dataclass behavior."""
+import dataclasses
 
-    def test_normal_content_result(self) -> None:
-        """PropertyReadResult stores normal content correctly."""
-        from pclipsync.clipboard_io import PropertyReadResult
+import pytest
 
-        result = PropertyReadResult(content=b"hello", is_incr=False)
-        assert result.content == b"hello"
-        assert result.is_incr is False
-        assert result.estimated_size == 0
+from pclipsync.clipboard_io import PropertyReadResult
 
-    def test_incr_result(self) -> None:
-        """PropertyReadResult stores INCR detection correctly."""
-        from pclipsync.clipboard_io import PropertyReadResult
+_TEST_RESULT = PropertyReadResult(content=b"test", is_incr=False)
 
-        result = PropertyReadResult(content=None, is_incr=True, estimated_size=1024)
-        assert result.content is None
-        assert result.is_incr is True
-        assert result.estimated_size == 1024
 
-    def test_failed_read_result(self) -> None:
-        """PropertyReadResult represents failed read correctly."""
-        from pclipsync.clipboard_io import PropertyReadResult
+class TestPropertyReadResult:
+    """Tests for PropertyReadResult dataclass behavior."""
 
-        result = PropertyReadResult(content=None, is_incr=False)
-        assert result.content is None
-        assert result.is_incr is False
-        assert result.estimated_size == 0
+    @pytest.mark.parametrize(
+        ("content", "is_incr", "size"),
+        [
+            (b"hello", False, 0),
+            (None, True, 1024),
+            (None, False, 0),
+        ],
+        ids=["normal", "incr", "failed"],
+    )
+    def test_stores_fields(
+        self, content: bytes | None, is_incr: bool, size: int
+    ) -> None:
+        """PropertyReadResult stores normal, INCR and failed reads correctly."""
+        if size:
+            result = PropertyReadResult(
+                content=content, is_incr=is_incr, estimated_size=size
+            )
+        else:
+            # Leave estimated_size out to cover its default of 0
+            result = PropertyReadResult(content=content, is_incr=is_incr)
+        assert result.content == content
+        assert result.is_incr is is_incr
+        assert result.estimated_size == size
 
     def test_equality(self) -> None:
         """PropertyReadResult instances are equal when fields match."""
-        from pclipsync.clipboard_io import PropertyReadResult
-
-        r1 = PropertyReadResult(content=b"test", is_incr=False)
-        r2 = PropertyReadResult(content=b"test", is_incr=False)
-        assert r1 == r2
+        assert _TEST_RESULT == PropertyReadResult(content=b"test", is_incr=False)
+        assert _TEST_RESULT != PropertyReadResult(content=b"other", is_incr=False)
 
-        r3 = PropertyReadResult(content=b"other", is_incr=False)
-        assert r1 != r3
+    def test_is_immutable(self) -> None:
+        """PropertyReadResult fields cannot be reassigned."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            _TEST_RESULT.content = b"changed"  # type: ignore[misc]
@@ -1,8 +1,19 @@
 #!/usr/bin/env python3
 """Tests for _read_selection_property function."""
+from array import array
 from unittest.mock import MagicMock
 
-import pytest
+from Xlib import X
+
+from pclipsync.clipboard_io import (
+    PROPERTY_SIZE_HINT,
+    PropertyReadResult,
+    _read_chunk_property,
+    _read_selection_property,
+)
+
+_UTF8_RESULT = PropertyReadResult(content=b"test content", is_incr=False)
+_FAILED_RESULT = PropertyReadResult(content=None, is_incr=False)
 
 
 class TestReadSelectionProperty:
@@ -10,8 +21,6 @@ class TestReadSelectionProperty:
 
     def test_normal_utf8_string_response(self) -> None:
         """Normal UTF8_STRING response returns content in PropertyReadResult."""
-        from pclipsync.clipboard_io import _read_selection_property, PropertyReadResult
-
         mock_display = MagicMock()
         mock_window = MagicMock()
         prop_atom = 123
@@ -24,18 +33,16 @@ class TestReadSelectionProperty:
 
         result = _read_selection_property(mock_display, mock_window, prop_atom, incr_atom)
 
-        assert isinstance(result, PropertyReadResult)
-        assert result.content == b"test content"
-        assert result.is_incr is False
-        assert result.estimated_size == 0
+        assert result == _UTF8_RESULT
 
         mock_window.delete_property.assert_called_once_with(prop_atom)
         mock_display.flush.assert_called_once()
+        mock_window.get_full_property.assert_called_once_with(
+            prop_atom, X.AnyPropertyType, sizehint=PROPERTY_SIZE_HINT
+        )
 
     def test_incr_response_detection(self) -> None:
         """INCR response returns is_incr=True with estimated_size."""
-        from pclipsync.clipboard_io import _read_selection_property, PropertyReadResult
-
         mock_display = MagicMock()
         mock_window = MagicMock()
         prop_atom = 123
@@ -49,17 +56,31 @@ class TestReadSelectionProperty:
 
         result = _read_selection_property(mock_display, mock_window, prop_atom, incr_atom)
 
-        assert isinstance(result, PropertyReadResult)
-        assert result.content is None
-        assert result.is_incr is True
-        assert result.estimated_size == estimated_size
+        assert result == PropertyReadResult(
+            content=None, is_incr=True, estimated_size=estimated_size
+        )
 
         mock_window.delete_property.assert_not_called()
 
+    def test_incr_size_from_format32_array(self) -> None:
+        """INCR size is read from the int array python-xlib decodes."""
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        incr_atom = 456
+
+        mock_prop = MagicMock()
+        mock_prop.property_type = incr_atom
+        mock_prop.value = array("I", [2097152])
+        mock_window.get_full_property.return_value = mock_prop
+
+        result = _read_selection_property(mock_display, mock_window, 123, incr_atom)
+
+        assert result == PropertyReadResult(
+            content=None, is_incr=True, estimated_size=2097152
+        )
+
     def test_empty_property_returns_failure_result(self) -> None:
         """Empty/None property returns PropertyReadResult with content=None."""
-        from pclipsync.clipboard_io import _read_selection_property, PropertyReadResult
-
         mock_display = MagicMock()
         mock_window = MagicMock()
         prop_atom = 123
@@ -69,7 +90,22 @@ class TestReadSelectionProperty:
 
         result = _read_selection_property(mock_display, mock_window, prop_atom, incr_atom)
 
-        assert isinstance(result, PropertyReadResult)
-        assert result.content is None
-        assert result.is_incr is False
-        assert result.estimated_size == 0
+        assert result == _FAILED_RESULT
+
+
+class TestReadChunkProperty:
+    """Tests for _read_chunk_property function."""
+
+    def test_queues_delete_without_flushing(self) -> None:
+        """Chunk reads queue the delete and leave flushing to the wait."""
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        mock_prop = MagicMock()
+        mock_prop.value = b"chunk"
+        mock_window.get_full_property.return_value = mock_prop
+
+        result = _read_chunk_property(mock_display, mock_window, 123)
+
+        assert result == b"chunk"
+        mock_window.delete_property.assert_called_once_with(123)
+        mock_display.flush.assert_not_called()
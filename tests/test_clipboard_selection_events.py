@@ -2,11 +2,15 @@
 """Tests for clipboard selection event processing."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import (
+    INCR_CHUNK_SIZE,
+    IncrSendState,
+    process_pending_events,
+)
+
 
 def test_process_pending_events_drains_deferred_first() -> None:
     """Deferred events are drained and prepended before pending events."""
-    from pclipsync.clipboard_selection import process_pending_events
-
     mock_display = MagicMock()
     mock_display.pending_events.return_value = 0  # No new pending events
 
@@ -22,8 +26,6 @@ def test_process_pending_events_drains_deferred_first() -> None:
 
 def test_process_pending_events_clears_deferred_list() -> None:
     """Deferred events list is cleared after draining."""
-    from pclipsync.clipboard_selection import process_pending_events
-
     mock_display = MagicMock()
     mock_display.pending_events.return_value = 0
 
@@ -32,3 +34,59 @@ def test_process_pending_events_clears_deferred_list() -> None:
     process_pending_events(mock_display, deferred_events)
 
     assert deferred_events == []
+
+
+def test_process_pending_events_routes_by_event_type() -> None:
+    """SelectionRequest is collected; unmatched PropertyNotify is dropped."""
+    from Xlib import X
+
+
+    sel_request = MagicMock()
+    sel_request.type = X.SelectionRequest
+    prop_notify = MagicMock()
+    prop_notify.type = X.PropertyNotify
+
+    mock_display = MagicMock()
+    mock_display.pending_events.side_effect = [1, 1, 0]
+    mock_display.next_event.side_effect = [prop_notify, sel_request]
+
+    result = process_pending_events(mock_display, [], {})
+
+    assert result == [sel_request]
+
+
+def test_process_pending_events_coalesces_incr_property_deletes() -> None:
+    """Repeated PropertyDelete for one INCR transfer sends a single chunk."""
+    from Xlib import X
+
+
+    mock_requestor = MagicMock()
+    mock_requestor.id = 12345
+    state = IncrSendState(
+        requestor=mock_requestor,
+        property_atom=123,
+        target_atom=456,
+        selection_atom=789,
+        content=b"x" * (INCR_CHUNK_SIZE * 3),
+        offset=0,
+        start_time=float("inf"),  # Never stale
+    )
+    pending_incr_sends = {(12345, 123): state}
+
+    def make_delete() -> MagicMock:
+        event = MagicMock()
+        event.type = X.PropertyNotify
+        event.state = X.PropertyDelete
+        event.window = mock_requestor
+        event.atom = 123
+        return event
+
+    mock_display = MagicMock()
+    mock_display.pending_events.side_effect = [1, 1, 0]
+    mock_display.next_event.side_effect = [make_delete(), make_delete()]
+
+    result = process_pending_events(mock_display, [], pending_incr_sends)
+
+    assert result == []
+    mock_requestor.change_property.assert_called_once()
+    assert state.offset == INCR_CHUNK_SIZE
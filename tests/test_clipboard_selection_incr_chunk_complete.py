@@ -2,15 +2,11 @@
 """Tests for send_incr_chunk completion behavior."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import IncrSendState, send_incr_chunk
+
 
 def test_send_incr_chunk_zero_length_completion() -> None:
     """Test send_incr_chunk sends zero-length chunk when all content sent."""
-    from pclipsync.clipboard_selection import (
-        send_incr_chunk,
-        IncrSendState,
-        INCR_CHUNK_SIZE,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
@@ -47,11 +43,6 @@ def test_send_incr_chunk_zero_length_completion() -> None:
 
 def test_send_incr_chunk_completion_sent_and_transfer_retained() -> None:
     """Test that after zero-length write, completion_sent is True and transfer retained."""
-    from pclipsync.clipboard_selection import (
-        send_incr_chunk,
-        IncrSendState,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
@@ -2,15 +2,15 @@
 """Tests for send_incr_chunk first chunk behavior."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import (
+    INCR_CHUNK_SIZE,
+    IncrSendState,
+    send_incr_chunk,
+)
+
 
 def test_send_incr_chunk_first_chunk() -> None:
     """Test send_incr_chunk sends correct first chunk from offset 0."""
-    from pclipsync.clipboard_selection import (
-        send_incr_chunk,
-        IncrSendState,
-        INCR_CHUNK_SIZE,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
@@ -2,15 +2,15 @@
 """Tests for send_incr_chunk subsequent chunk behavior."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import (
+    INCR_CHUNK_SIZE,
+    IncrSendState,
+    send_incr_chunk,
+)
+
 
 def test_send_incr_chunk_subsequent_chunk() -> None:
     """Test send_incr_chunk sends correct subsequent chunk with offset."""
-    from pclipsync.clipboard_selection import (
-        send_incr_chunk,
-        IncrSendState,
-        INCR_CHUNK_SIZE,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
@@ -48,3 +48,28 @@ def test_send_incr_chunk_subsequent_chunk() -> None:
 
     # Verify completion_sent is still False
     assert state.completion_sent is False
+
+
+def test_send_incr_chunk_final_partial_chunk() -> None:
+    """Test send_incr_chunk sends the short trailing chunk and reaches the end."""
+    mock_display = MagicMock()
+    mock_requestor = MagicMock()
+    mock_requestor.id = 12345
+
+    content = b"a" * INCR_CHUNK_SIZE + b"b" * 100
+
+    state = IncrSendState(
+        requestor=mock_requestor,
+        property_atom=123,
+        target_atom=456,
+        selection_atom=789,
+        content=content,
+        offset=INCR_CHUNK_SIZE,
+        start_time=0.0,
+    )
+
+    transfer_key = (mock_requestor.id, 123)
+    send_incr_chunk(mock_display, state, transfer_key, {transfer_key: state})
+
+    mock_requestor.change_property.assert_called_once_with(123, 456, 8, b"b" * 100)
+    assert state.offset == len(content)
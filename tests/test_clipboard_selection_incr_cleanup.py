@@ -2,14 +2,17 @@
 """Tests for INCR transfer cleanup and unsubscribe behavior."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import (
+    INCR_SEND_TIMEOUT,
+    IncrSendState,
+    cleanup_incr_sends_on_ownership_loss,
+    cleanup_stale_incr_sends,
+    unsubscribe_incr_requestor,
+)
+
 
 def test_unsubscribe_incr_requestor_removes_transfer_and_unsubscribes() -> None:
     """Test cleanup removes transfer and unsubscribes when last for window."""
-    from pclipsync.clipboard_selection import (
-        unsubscribe_incr_requestor,
-        IncrSendState,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
@@ -48,11 +51,6 @@ def test_unsubscribe_incr_requestor_removes_transfer_and_unsubscribes() -> None:
 def test_cleanup_stale_incr_sends_removes_timed_out_transfers() -> None:
     """Test that stale transfers exceeding timeout are cleaned up."""
     import time
-    from pclipsync.clipboard_selection import (
-        cleanup_stale_incr_sends,
-        IncrSendState,
-        INCR_SEND_TIMEOUT,
-    )
 
     mock_display = MagicMock()
     mock_requestor = MagicMock()
@@ -110,11 +108,6 @@ def test_cleanup_stale_incr_sends_removes_timed_out_transfers() -> None:
 
 def test_cleanup_incr_sends_on_ownership_loss_clears_matching_transfers() -> None:
     """Test that ownership loss clears all pending transfers for that selection."""
-    from pclipsync.clipboard_selection import (
-        cleanup_incr_sends_on_ownership_loss,
-        IncrSendState,
-    )
-
     mock_display = MagicMock()
 
     # Create two transfers for selection 100 (CLIPBOARD)
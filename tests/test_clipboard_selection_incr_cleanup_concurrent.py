@@ -2,14 +2,11 @@
 """Tests for INCR transfer cleanup with concurrent transfers."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import IncrSendState, unsubscribe_incr_requestor
+
 
 def test_unsubscribe_incr_requestor_concurrent_transfers() -> None:
     """Test cleanup with two concurrent transfers to same requestor."""
-    from pclipsync.clipboard_selection import (
-        unsubscribe_incr_requestor,
-        IncrSendState,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
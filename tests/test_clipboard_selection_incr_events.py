@@ -2,15 +2,15 @@
 """Tests for INCR send event routing (is_incr_send_event, handle_incr_send_event)."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import (
+    IncrSendState,
+    handle_incr_send_event,
+    is_incr_send_event,
+)
+
 
 def test_property_delete_triggers_chunk_send() -> None:
     """Test PropertyNotify with PropertyDelete state triggers chunk send."""
-    from pclipsync.clipboard_selection import (
-        is_incr_send_event,
-        handle_incr_send_event,
-        IncrSendState,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
@@ -53,8 +53,6 @@ def test_property_delete_triggers_chunk_send() -> None:
 
 def test_property_new_value_ignored() -> None:
     """Test PropertyNotify with PropertyNewValue state is ignored."""
-    from pclipsync.clipboard_selection import is_incr_send_event, IncrSendState
-
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
 
@@ -87,8 +85,6 @@ def test_property_new_value_ignored() -> None:
 
 def test_property_delete_untracked_window_ignored() -> None:
     """Test PropertyNotify for untracked window is ignored."""
-    from pclipsync.clipboard_selection import is_incr_send_event, IncrSendState
-
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
 
@@ -124,12 +120,6 @@ def test_property_delete_untracked_window_ignored() -> None:
 
 def test_destroy_notify_triggers_cleanup() -> None:
     """Test DestroyNotify for tracked requestor window triggers cleanup."""
-    from pclipsync.clipboard_selection import (
-        is_incr_send_event,
-        handle_incr_send_event,
-        IncrSendState,
-    )
-
     mock_display = MagicMock()
     mock_requestor = MagicMock()
     mock_requestor.id = 12345
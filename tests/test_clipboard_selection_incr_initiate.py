@@ -2,15 +2,15 @@
 """Tests for INCR transfer initiation with large content."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import (
+    INCR_SAFETY_MARGIN,
+    IncrSendState,
+    handle_selection_request,
+)
+
 
 def test_handle_selection_request_large_content_initiates_incr() -> None:
     """Test that large content initiates INCR transfer and creates pending entry."""
-    from pclipsync.clipboard_selection import (
-        handle_selection_request,
-        IncrSendState,
-        INCR_SAFETY_MARGIN,
-    )
-
     mock_display = MagicMock()
     # Set max_request_length low so content exceeds threshold
     mock_display.display.info.max_request_length = 100  # 400 bytes max, ~360 with margin
@@ -22,12 +22,12 @@ def test_handle_selection_request_large_content_initiates_incr() -> None:
     mock_event.selection = 456
     mock_event.time = 789
 
-    # Make intern_atom return different values for different atoms
-    def intern_atom_side_effect(name: str) -> int:
+    # Make get_atom return different values for different atoms
+    def get_atom_side_effect(name: str) -> int:
         atoms = {"TARGETS": 1, "UTF8_STRING": 2, "TIMESTAMP": 3}
         return atoms.get(name, 99)
 
-    mock_display.intern_atom.side_effect = intern_atom_side_effect
+    mock_display.get_atom.side_effect = get_atom_side_effect
     mock_event.target = 2  # UTF8_STRING
 
     # Large content exceeding threshold
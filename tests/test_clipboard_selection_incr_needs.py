@@ -2,11 +2,11 @@
 """Tests for needs_incr_transfer function."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import INCR_SAFETY_MARGIN, needs_incr_transfer
+
 
 def test_needs_incr_transfer_false_for_small_content() -> None:
     """Test needs_incr_transfer returns False for content under threshold."""
-    from pclipsync.clipboard_selection import needs_incr_transfer
-
     mock_display = MagicMock()
     # Set max_request_length to 65536 (256KB max property size)
     mock_display.display.info.max_request_length = 65536
@@ -18,8 +18,6 @@ def test_needs_incr_transfer_false_for_small_content() -> None:
 
 def test_needs_incr_transfer_true_for_large_content() -> None:
     """Test needs_incr_transfer returns True for content exceeding threshold."""
-    from pclipsync.clipboard_selection import needs_incr_transfer, INCR_SAFETY_MARGIN
-
     mock_display = MagicMock()
     # Set max_request_length to 1000 (4000 bytes max, ~3600 with safety margin)
     mock_display.display.info.max_request_length = 1000
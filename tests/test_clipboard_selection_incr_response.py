@@ -2,15 +2,15 @@
 """Tests for INCR response format (type and size)."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import (
+    INCR_SAFETY_MARGIN,
+    IncrSendState,
+    handle_selection_request,
+)
+
 
 def test_incr_response_has_correct_type_and_size() -> None:
     """Test INCR response writes INCR type with content length as value."""
-    from pclipsync.clipboard_selection import (
-        handle_selection_request,
-        IncrSendState,
-        INCR_SAFETY_MARGIN,
-    )
-
     mock_display = MagicMock()
     # Set max_request_length low so content exceeds threshold
     mock_display.display.info.max_request_length = 100
@@ -22,11 +22,11 @@ def test_incr_response_has_correct_type_and_size() -> None:
     mock_event.selection = 456
     mock_event.time = 789
 
-    def intern_atom_side_effect(name: str) -> int:
+    def get_atom_side_effect(name: str) -> int:
         atoms = {"TARGETS": 1, "UTF8_STRING": 2, "TIMESTAMP": 3}
         return atoms.get(name, 99)
 
-    mock_display.intern_atom.side_effect = intern_atom_side_effect
+    mock_display.get_atom.side_effect = get_atom_side_effect
     mock_event.target = 2  # UTF8_STRING
 
     # Large content exceeding threshold
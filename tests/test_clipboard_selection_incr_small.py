@@ -2,28 +2,28 @@
 """Tests for small content direct clipboard transfer (non-INCR)."""
 from unittest.mock import MagicMock
 
+from pclipsync.clipboard_selection import IncrSendState, handle_selection_request
+
 
 def test_handle_selection_request_small_content_uses_direct_change_property() -> None:
     """Test that small content uses direct change_property, not INCR."""
-    from pclipsync.clipboard_selection import handle_selection_request, IncrSendState
-
     mock_display = MagicMock()
     # Set max_request_length high enough that content is "small"
     mock_display.display.info.max_request_length = 65536  # 256KB max
 
     mock_event = MagicMock()
-    mock_event.target = mock_display.intern_atom.return_value  # UTF8_STRING
+    mock_event.target = mock_display.get_atom.return_value  # UTF8_STRING
     mock_event.requestor = MagicMock()
     mock_event.property = 123
     mock_event.selection = 456
     mock_event.time = 789
 
-    # Make intern_atom return different values for different atoms
-    def intern_atom_side_effect(name: str) -> int:
+    # Make get_atom return different values for different atoms
+    def get_atom_side_effect(name: str) -> int:
         atoms = {"TARGETS": 1, "UTF8_STRING": 2, "TIMESTAMP": 3}
         return atoms.get(name, 99)
 
-    mock_display.intern_atom.side_effect = intern_atom_side_effect
+    mock_display.get_atom.side_effect = get_atom_side_effect
     mock_event.target = 2  # UTF8_STRING
 
     small_content = b"Hello, World!"
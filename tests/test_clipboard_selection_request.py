@@ -4,6 +4,8 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from pclipsync.clipboard_selection import handle_selection_request
+
 
 @pytest.fixture
 def mock_display() -> MagicMock:
@@ -11,7 +13,7 @@ def mock_display() -> MagicMock:
     display = MagicMock()
     # Return distinct atom values for each interned atom
     atom_map = {"TARGETS": 100, "UTF8_STRING": 101, "TIMESTAMP": 102}
-    display.intern_atom.side_effect = lambda name: atom_map.get(name, 999)
+    display.get_atom.side_effect = lambda name: atom_map.get(name, 999)
     display.display.info.max_request_length = 65536  # Large enough for small content
     return display
 
@@ -32,9 +34,10 @@ def test_targets_includes_timestamp(
     mock_display: MagicMock, mock_event: MagicMock
 ) -> None:
     """Test TARGETS response includes TIMESTAMP atom."""
-    from pclipsync.clipboard_selection import handle_selection_request
+    import struct
+
 
-    # Request TARGETS (use mock_display.intern_atom return value)
+    # Request TARGETS (use mock_display.get_atom return value)
     mock_event.target = 100  # TARGETS atom from fixture
 
     handle_selection_request(mock_display, mock_event, b"test content", None, {}, 0)
@@ -42,9 +45,11 @@ def test_targets_includes_timestamp(
     # Verify change_property was called with targets list including TIMESTAMP
     mock_event.requestor.change_property.assert_called_once()
     call_args = mock_event.requestor.change_property.call_args
-    targets_list = call_args[0][3]  # Fourth positional arg is the data
+    targets_list = struct.unpack("=4I", call_args[0][3])  # Packed 32-bit atoms
     # Check TIMESTAMP atom (102 from fixture) is in targets list
     assert 102 in targets_list
+    # Atoms come from the display's cache, not a fresh InternAtom request
+    mock_display.intern_atom.assert_not_called()
 
 
 def test_timestamp_request_returns_integer(
@@ -52,7 +57,6 @@ def test_timestamp_request_returns_integer(
 ) -> None:
     """Test TIMESTAMP request returns acquisition_time as 32-bit INTEGER."""
     from Xlib import Xatom
-    from pclipsync.clipboard_selection import handle_selection_request
 
     # Request TIMESTAMP
     mock_event.target = 102  # TIMESTAMP atom
@@ -74,8 +78,6 @@ def test_timestamp_request_has_valid_property(
     mock_display: MagicMock, mock_event: MagicMock
 ) -> None:
     """Test TIMESTAMP request results in SelectionNotify with valid property."""
-    from pclipsync.clipboard_selection import handle_selection_request
-
     mock_event.target = 102  # TIMESTAMP atom
     original_property = mock_event.property
 
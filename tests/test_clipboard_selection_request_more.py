@@ -4,13 +4,15 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from pclipsync.clipboard_selection import handle_selection_request
+
 
 @pytest.fixture
 def mock_display() -> MagicMock:
     """Create a mock X11 display."""
     display = MagicMock()
     atom_map = {"TARGETS": 100, "UTF8_STRING": 101, "TIMESTAMP": 102}
-    display.intern_atom.side_effect = lambda name: atom_map.get(name, 999)
+    display.get_atom.side_effect = lambda name: atom_map.get(name, 999)
     display.display.info.max_request_length = 65536  # Large enough for small content
     return display
 
@@ -31,8 +33,6 @@ def test_utf8_string_still_works(
     mock_display: MagicMock, mock_event: MagicMock
 ) -> None:
     """Regression test: UTF8_STRING requests still work correctly."""
-    from pclipsync.clipboard_selection import handle_selection_request
-
     mock_event.target = 101  # UTF8_STRING atom
     content = b"test clipboard content"
 
@@ -53,7 +53,6 @@ def test_unsupported_target_refused(
 ) -> None:
     """Regression test: unsupported targets are still refused."""
     from Xlib import X
-    from pclipsync.clipboard_selection import handle_selection_request
 
     mock_event.target = 999  # Unknown target
 
@@ -68,7 +67,6 @@ def test_timestamp_refused_when_acquisition_time_none(
 ) -> None:
     """Test TIMESTAMP request refused when acquisition_time is None."""
     from Xlib import X
-    from pclipsync.clipboard_selection import handle_selection_request
 
     # Request TIMESTAMP
     mock_event.target = 102  # TIMESTAMP atom
@@ -79,3 +77,16 @@ def test_timestamp_refused_when_acquisition_time_none(
     assert mock_event.property == X.NONE
     # change_property should NOT be called
     mock_event.requestor.change_property.assert_not_called()
+
+
+def test_content_request_flushes_once(
+    mock_display: MagicMock, mock_event: MagicMock
+) -> None:
+    """Test non-INCR content reply is sent with a single display flush."""
+    mock_event.target = 101  # UTF8_STRING atom
+
+    handle_selection_request(mock_display, mock_event, b"content", None, {}, 0)
+
+    mock_event.requestor.change_property.assert_called_once()
+    mock_event.requestor.send_event.assert_called_once()
+    mock_display.flush.assert_called_once()
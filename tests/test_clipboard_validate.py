@@ -5,14 +5,13 @@ Tests clipboard display validation with mocked X11 connections.
 
 from unittest.mock import patch
 
-import pytest
+from pclipsync.clipboard import validate_display
 
 
 def _validate_with_no_display() -> int:
     """Call validate_display with DISPLAY unset and return exit code."""
     with patch.dict("os.environ", {}, clear=True):
         try:
-            from pclipsync.clipboard import validate_display
             validate_display()
             return 0
         except SystemExit as e:
@@ -25,7 +24,6 @@ def _validate_with_connection_failure() -> int:
         patch("Xlib.display.Display") as mock_display:
         mock_display.side_effect = Exception("Connection refused")
         try:
-            from pclipsync.clipboard import validate_display
             validate_display()
             return 0
         except SystemExit as e:
@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 """
-Unit tests for compute_hash SHA-256 function.
+Unit tests for compute_hash BLAKE2b function.
 
-Tests that compute_hash produces consistent 64-character hex digests
+Tests that compute_hash produces consistent 16-byte digests
 and different inputs produce different outputs.
 """
 from pclipsync.hashing import compute_hash
 
 
-def test_compute_hash_produces_sha256_hex() -> None:
-    """Test compute_hash returns 64-character hex SHA-256 digest."""
+def test_compute_hash_produces_blake2b_digest() -> None:
+    """Test compute_hash returns 16-byte BLAKE2b digest."""
+    import hashlib
+
     result = compute_hash(b"test content")
-    assert len(result) == 64
-    assert all(c in "0123456789abcdef" for c in result)
+    assert isinstance(result, bytes)
+    assert len(result) == 16
+    assert result == hashlib.blake2b(b"test content", digest_size=16).digest()
 
 
 def test_compute_hash_consistent_output() -> None:
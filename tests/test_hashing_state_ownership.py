@@ -23,7 +23,7 @@ def test_hashstate_ownership_loss_unblocks_previously_received_content() -> None
     state = HashState()
 
     # Step 1: Receive content with hash H from remote
-    hash_h = "abc123def456"
+    hash_h = b"abc123def456"
     state.record_received(hash_h)
     assert state.last_received_hash == hash_h
 
@@ -61,7 +61,7 @@ def test_hashstate_ownership_loss_unblocks_previously_sent_content() -> None:
     state = HashState()
 
     # Step 1: Send content with hash H to remote
-    hash_h = "f60261fd10b7face"  # Actual hash from bug report
+    hash_h = b"f60261fd10b7face"  # Actual hash from bug report
     state.record_sent(hash_h)
     assert state.last_sent_hash == hash_h
 
@@ -5,7 +5,6 @@ Tests for client reconnection and graceful shutdown.
 Run with: pytest -m integration
 """
 
-import os
 from pathlib import Path
 
 import pytest
@@ -5,7 +5,6 @@ Tests for round-trip sync, loop prevention, and selection updates.
 Run with: pytest -m integration
 """
 
-import os
 from pathlib import Path
 
 import pytest
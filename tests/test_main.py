@@ -1,5 +1,4 @@
 """Tests for CLI argument handling in main.py."""
-import pytest
 from click.testing import CliRunner
 
 from pclipsync.main import main
@@ -48,3 +48,49 @@ def test_validate_content_size_over_limit() -> None:
     """Test content over limit returns False."""
     data = b"x" * (MAX_CONTENT_SIZE + 1)
     assert validate_content_size(data) is False
+
+
+@pytest.mark.asyncio
+async def test_write_netstring_matches_encode_netstring() -> None:
+    """Test write_netstring emits the same bytes as encode_netstring."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from pclipsync.protocol import write_netstring
+
+    writer = AsyncMock()
+    writer.writelines = MagicMock()
+    await write_netstring(writer, b"Hello world!")
+
+    parts = writer.writelines.call_args[0][0]
+    assert b"".join(parts) == encode_netstring(b"Hello world!")
+    writer.drain.assert_called_once()
+
+
+def test_configure_stream_writer_sets_limits_and_sndbuf() -> None:
+    """Test configure_stream_writer zeroes high-water mark and sizes SO_SNDBUF."""
+    import socket
+    from unittest.mock import MagicMock
+
+    from pclipsync.protocol import SOCKET_SNDBUF_SIZE, configure_stream_writer
+
+    writer = MagicMock()
+    sock = writer.get_extra_info.return_value
+    configure_stream_writer(writer)
+
+    writer.transport.set_write_buffer_limits.assert_called_once_with(high=0)
+    sock.setsockopt.assert_called_once_with(
+        socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF_SIZE
+    )
+
+
+def test_configure_stream_writer_ignores_sndbuf_error() -> None:
+    """Test configure_stream_writer tolerates the kernel refusing SO_SNDBUF."""
+    from unittest.mock import MagicMock
+
+    from pclipsync.protocol import configure_stream_writer
+
+    writer = MagicMock()
+    writer.get_extra_info.return_value.setsockopt.side_effect = OSError("refused")
+    configure_stream_writer(writer)
+
+    writer.transport.set_write_buffer_limits.assert_called_once_with(high=0)
@@ -46,3 +46,46 @@ async def test_round_trip_encode_decode() -> None:
     reader = make_reader(encoded)
     result = await read_netstring(reader)
     assert result == original
+
+
+@pytest.mark.asyncio
+async def test_read_netstring_consecutive_messages() -> None:
+    """Test back-to-back netstrings in one buffer are read one at a time."""
+    reader = make_reader(b"5:hello,0:,3:a:b,")
+    assert await read_netstring(reader) == b"hello"
+    assert await read_netstring(reader) == b""
+    assert await read_netstring(reader) == b"a:b"
+
+
+@pytest.mark.asyncio
+async def test_read_netstring_large_content() -> None:
+    """Test content above the fused-read threshold is read intact."""
+    from pclipsync.protocol import FUSED_READ_THRESHOLD
+
+    original = bytes(range(256)) * (FUSED_READ_THRESHOLD // 256 + 1)
+    reader = make_reader(encode_netstring(original) + encode_netstring(b"next"))
+    assert await read_netstring(reader) == original
+    assert await read_netstring(reader) == b"next"
+
+
+async def test_write_then_read_over_socket(
+    stream_pair: tuple[asyncio.StreamReader, asyncio.StreamWriter],
+) -> None:
+    """Test a tuned writer and read_netstring agree over a real socket."""
+    from pclipsync.protocol import (
+        MAX_CONTENT_SIZE,
+        configure_stream_writer,
+        write_netstring,
+    )
+
+    reader, writer = stream_pair
+    configure_stream_writer(writer)
+    content = bytes(range(256)) * (MAX_CONTENT_SIZE // 256)
+
+    # Read concurrently: the frame is larger than the socket buffers
+    read_task = asyncio.create_task(read_netstring(reader))
+    await write_netstring(writer, content)
+    await write_netstring(writer, b"small")
+
+    assert await read_task == content
+    assert await read_netstring(reader) == b"small"
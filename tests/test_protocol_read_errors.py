@@ -9,6 +9,8 @@ import asyncio
 import pytest
 
 from pclipsync.protocol import (
+    MAX_LENGTH_DIGITS,
+    STREAM_READER_LIMIT,
     ProtocolError,
     read_netstring,
 )
@@ -22,6 +24,13 @@ def make_reader(data: bytes) -> asyncio.StreamReader:
     return reader
 
 
+def make_open_reader(data: bytes) -> asyncio.StreamReader:
+    """Create a StreamReader with the given data and no EOF."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    return reader
+
+
 @pytest.mark.asyncio
 async def test_read_netstring_missing_colon() -> None:
     """Test ProtocolError raised for missing colon separator."""
@@ -85,3 +94,43 @@ async def test_read_netstring_incomplete_read_raises_protocol_error() -> None:
     reader = make_reader(b"10:abc")
     with pytest.raises(ProtocolError, match="Connection closed"):
         await read_netstring(reader)
+
+
+@pytest.mark.asyncio
+async def test_read_netstring_large_content_missing_comma() -> None:
+    """Test missing terminator is reported for content read on its own."""
+    from pclipsync.protocol import FUSED_READ_THRESHOLD
+
+    length = FUSED_READ_THRESHOLD
+    reader = make_reader(b"%d:" % length + b"x" * length + b";")
+    with pytest.raises(ProtocolError, match="Expected comma"):
+        await read_netstring(reader)
+
+
+@pytest.mark.asyncio
+async def test_read_netstring_malformed_prefix_on_open_stream() -> None:
+    """Test a non-digit prefix is rejected without waiting for a colon."""
+    reader = make_open_reader(b"abc")
+    with pytest.raises(ProtocolError, match="Invalid character"):
+        await asyncio.wait_for(read_netstring(reader), timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_read_netstring_overlong_prefix_on_open_stream() -> None:
+    """Test too many digits are rejected without waiting for a colon."""
+    reader = make_open_reader(b"123456789012")
+    with pytest.raises(ProtocolError, match="exceeds maximum digits"):
+        await asyncio.wait_for(read_netstring(reader), timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_read_netstring_header_bound_independent_of_reader_limit() -> None:
+    """Test junk is rejected after at most MAX_LENGTH_DIGITS + 1 bytes."""
+    data = b"9" * 4096
+    reader = asyncio.StreamReader(limit=STREAM_READER_LIMIT)
+    reader.feed_data(data)
+    with pytest.raises(ProtocolError, match="exceeds maximum digits"):
+        await asyncio.wait_for(read_netstring(reader), timeout=0.5)
+    reader.feed_eof()
+    rest = await reader.read()
+    assert len(rest) == len(data) - (MAX_LENGTH_DIGITS + 1)
@@ -30,3 +30,29 @@ class TestGetOtherSelection:
         other_atom = 456
         result = get_other_selection(other_atom, clipboard_atom)
         assert result == clipboard_atom
+
+
+class TestGetServerTimestamp:
+    """Tests for get_server_timestamp function."""
+
+    def test_uses_cached_atom_without_interning(self) -> None:
+        """Change the cached property atom and return the event time."""
+        from unittest.mock import MagicMock
+
+        from Xlib import X
+
+        from pclipsync.selection_utils import get_server_timestamp
+
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        notify = MagicMock()
+        notify.type = X.PropertyNotify
+        notify.time = 4242
+        mock_display.pending_events.return_value = 1
+        mock_display.next_event.return_value = notify
+
+        result = get_server_timestamp(mock_display, mock_window, [], 77)
+
+        assert result == 4242
+        assert mock_window.change_property.call_args[0][0] == 77
+        mock_display.intern_atom.assert_not_called()
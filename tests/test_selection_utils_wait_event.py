@@ -8,6 +8,8 @@ from unittest.mock import MagicMock
 
 from Xlib import X
 
+from conftest_display import FakeDisplay
+from conftest_events import make_owner_notify
 from pclipsync.selection_utils import wait_for_event_type
 
 
@@ -32,16 +34,13 @@ class TestWaitForEventType:
 
     def test_defers_selection_request_events(self) -> None:
         """Defer SelectionRequest events until target found."""
-        mock_display = MagicMock()
-
         req_event = MagicMock()
         req_event.type = X.SelectionRequest
 
         target_event = MagicMock()
         target_event.type = X.PropertyNotify
 
-        mock_display.next_event.side_effect = [req_event, target_event]
-        mock_display.pending_events.side_effect = [1, 1, 0]
+        mock_display = FakeDisplay([req_event, target_event], [1, 1])
 
         deferred: list = []
         result = wait_for_event_type(
@@ -50,20 +49,41 @@ class TestWaitForEventType:
 
         assert result == target_event
         assert deferred == [req_event]
+        mock_display.assert_consumed()
 
     def test_defers_set_selection_owner_notify(self) -> None:
         """Defer SetSelectionOwnerNotify events until target found."""
+        owner_event = make_owner_notify(type=999)  # Non-standard type
+
+        target_event = MagicMock()
+        target_event.type = X.SelectionNotify
+
+        mock_display = FakeDisplay([owner_event, target_event], [1, 1])
+
+        deferred: list = []
+        result = wait_for_event_type(
+            mock_display, X.SelectionNotify, deferred, timeout=1.0
+        )
+
+        assert result == target_event
+        assert deferred == [owner_event]
+        mock_display.assert_consumed()
+
+    def test_drops_repeated_owner_changes(self) -> None:
+        """Defer only the first of identical SetSelectionOwnerNotify events."""
         mock_display = MagicMock()
 
-        owner_event = MagicMock()
-        owner_event.type = 999  # Non-standard type
-        type(owner_event).__name__ = "SetSelectionOwnerNotify"
+        first = make_owner_notify(type=999, owner=7, selection_timestamp=100)
+        repeat = make_owner_notify(type=999, owner=7, selection_timestamp=100)
+        newer = make_owner_notify(type=999, owner=7, selection_timestamp=200)
 
         target_event = MagicMock()
         target_event.type = X.SelectionNotify
 
-        mock_display.next_event.side_effect = [owner_event, target_event]
-        mock_display.pending_events.side_effect = [1, 1, 0]
+        mock_display.next_event.side_effect = iter(
+            (first, repeat, newer, target_event)
+        )
+        mock_display.pending_events.return_value = 4
 
         deferred: list = []
         result = wait_for_event_type(
@@ -71,4 +91,4 @@ class TestWaitForEventType:
         )
 
         assert result == target_event
-        assert deferred == [owner_event]
+        assert deferred == [first, newer]
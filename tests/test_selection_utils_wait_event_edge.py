@@ -8,7 +8,8 @@ from unittest.mock import MagicMock, patch
 
 from Xlib import X
 
-from pclipsync.selection_utils import wait_for_event_type
+from conftest_display import FakeDisplay
+from pclipsync.selection_utils import MAX_EVENTS_PER_PASS, wait_for_event_type
 
 
 class TestWaitForEventTypeEdgeCases:
@@ -16,8 +17,6 @@ class TestWaitForEventTypeEdgeCases:
 
     def test_ignores_other_events(self) -> None:
         """Discard events that are not target or deferrable types."""
-        mock_display = MagicMock()
-
         other_event = MagicMock()
         other_event.type = X.Expose  # Not deferrable
         type(other_event).__name__ = "Expose"
@@ -25,8 +24,7 @@ class TestWaitForEventTypeEdgeCases:
         target_event = MagicMock()
         target_event.type = X.SelectionNotify
 
-        mock_display.next_event.side_effect = [other_event, target_event]
-        mock_display.pending_events.side_effect = [1, 1, 0]
+        mock_display = FakeDisplay([other_event, target_event], [1, 1])
 
         deferred: list = []
         result = wait_for_event_type(
@@ -35,18 +33,56 @@ class TestWaitForEventTypeEdgeCases:
 
         assert result == target_event
         assert deferred == []  # other_event was discarded, not deferred
+        mock_display.assert_consumed()
 
     def test_returns_none_on_timeout(self) -> None:
-        """Return None when select times out waiting for events."""
+        """Return None when poll times out waiting for events."""
         mock_display = MagicMock()
         mock_display.pending_events.return_value = 0
         mock_display.fileno.return_value = 3
 
         deferred: list = []
-        with patch("select.select", return_value=([], [], [])):
+        with patch("select.poll") as mock_poll:
+            mock_poll.return_value.poll.return_value = []
             result = wait_for_event_type(
                 mock_display, X.SelectionNotify, deferred, timeout=0.1
             )
 
         assert result is None
         assert deferred == []
+
+    def test_checks_deadline_between_capped_batches(self) -> None:
+        """Stop after one capped batch once the deadline has passed."""
+        mock_display = MagicMock()
+        other_event = MagicMock()
+        other_event.type = X.Expose
+        mock_display.next_event.return_value = other_event
+        mock_display.pending_events.return_value = MAX_EVENTS_PER_PASS * 4
+
+        deferred: list = []
+        result = wait_for_event_type(
+            mock_display, X.SelectionNotify, deferred, timeout=0.0
+        )
+
+        assert result is None
+        assert mock_display.next_event.call_count == MAX_EVENTS_PER_PASS
+
+    def test_consumes_reported_events_before_asking_again(self) -> None:
+        """Drain everything pending_events() reported before re-querying it."""
+        mock_display = MagicMock()
+        other_event = MagicMock()
+        other_event.type = X.Expose
+        target_event = MagicMock()
+        target_event.type = X.SelectionNotify
+        total = MAX_EVENTS_PER_PASS * 2
+        mock_display.next_event.side_effect = iter(
+            [other_event] * (total - 1) + [target_event]
+        )
+        mock_display.pending_events.return_value = total
+
+        result = wait_for_event_type(
+            mock_display, X.SelectionNotify, [], timeout=1.0
+        )
+
+        assert result is target_event
+        assert mock_display.pending_events.call_count == 1
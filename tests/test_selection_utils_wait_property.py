@@ -4,10 +4,12 @@
 Uses mocks for X11 display to avoid requiring a real display.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from Xlib import X
 
+from conftest_display import FakeDisplay
+from conftest_events import make_owner_notify
 from pclipsync.selection_utils import wait_for_property_notify
 
 
@@ -39,7 +41,6 @@ class TestWaitForPropertyNotify:
 
     def test_defers_selection_request_before_match(self) -> None:
         """Defer SelectionRequest events until matching PropertyNotify found."""
-        mock_display = MagicMock()
         mock_window = MagicMock()
         prop_atom = 123
 
@@ -52,8 +53,7 @@ class TestWaitForPropertyNotify:
         target_event.atom = prop_atom
         target_event.state = X.PropertyNewValue
 
-        mock_display.next_event.side_effect = [req_event, target_event]
-        mock_display.pending_events.side_effect = [1, 1, 0]
+        mock_display = FakeDisplay([req_event, target_event], [1, 1])
 
         deferred: list = []
         result = wait_for_property_notify(
@@ -62,16 +62,14 @@ class TestWaitForPropertyNotify:
 
         assert result == target_event
         assert deferred == [req_event]
+        mock_display.assert_consumed()
 
     def test_defers_set_selection_owner_notify_before_match(self) -> None:
         """Defer SetSelectionOwnerNotify events until matching PropertyNotify found."""
-        mock_display = MagicMock()
         mock_window = MagicMock()
         prop_atom = 123
 
-        owner_event = MagicMock()
-        owner_event.type = 999  # Non-standard type
-        type(owner_event).__name__ = "SetSelectionOwnerNotify"
+        owner_event = make_owner_notify(type=999)  # Non-standard type
 
         target_event = MagicMock()
         target_event.type = X.PropertyNotify
@@ -79,8 +77,7 @@ class TestWaitForPropertyNotify:
         target_event.atom = prop_atom
         target_event.state = X.PropertyNewValue
 
-        mock_display.next_event.side_effect = [owner_event, target_event]
-        mock_display.pending_events.side_effect = [1, 1, 0]
+        mock_display = FakeDisplay([owner_event, target_event], [1, 1])
 
         deferred: list = []
         result = wait_for_property_notify(
@@ -89,3 +86,40 @@ class TestWaitForPropertyNotify:
 
         assert result == target_event
         assert deferred == [owner_event]
+        mock_display.assert_consumed()
+
+    def test_flushes_before_blocking(self) -> None:
+        """Flush queued requests before polling the display fd."""
+        mock_display = MagicMock()
+        mock_display.pending_events.return_value = 0
+        mock_display.fileno.return_value = 3
+        calls: list[str] = []
+        mock_display.flush.side_effect = lambda: calls.append("flush")
+
+        deferred: list = []
+        with patch("select.poll") as mock_poll:
+            mock_poll.return_value.poll.side_effect = (
+                lambda _: calls.append("poll") or []
+            )
+            result = wait_for_property_notify(
+                mock_display, MagicMock(), 123, deferred, timeout=0.1
+            )
+
+        assert result is None
+        assert calls == ["flush", "poll"]
+
+    def test_no_flush_when_event_already_queued(self) -> None:
+        """Return a queued match without flushing."""
+        mock_display = MagicMock()
+        mock_window = MagicMock()
+        mock_event = MagicMock()
+        mock_event.type = X.PropertyNotify
+        mock_event.window = mock_window
+        mock_event.atom = 123
+        mock_event.state = X.PropertyNewValue
+        mock_display.next_event.return_value = mock_event
+        mock_display.pending_events.return_value = 1
+
+        wait_for_property_notify(mock_display, mock_window, 123, [], timeout=1.0)
+
+        mock_display.flush.assert_not_called()
@@ -15,11 +15,11 @@ async def test_run_server_raises_exception_from_exception_holder() -> None:
     error = ProtocolError("test error")
 
     # Mock all the X11 and socket setup at their source modules
-    with patch("pclipsync.clipboard.validate_display") as mock_display, \
-        patch("pclipsync.clipboard.create_hidden_window") as mock_window, \
-        patch("pclipsync.clipboard_events.register_xfixes_events"), \
-        patch("pclipsync.server_socket.check_socket_state"), \
-        patch("pclipsync.server_socket.print_startup_message"), \
+    with patch("pclipsync.server.validate_display") as mock_display, \
+        patch("pclipsync.server.create_hidden_window") as mock_window, \
+        patch("pclipsync.server.register_xfixes_events"), \
+        patch("pclipsync.server.check_socket_state"), \
+        patch("pclipsync.server.print_startup_message"), \
         patch("asyncio.start_unix_server") as mock_start_server:
 
         mock_display.return_value = MagicMock()
@@ -43,8 +43,10 @@ async def test_run_server_raises_exception_from_exception_holder() -> None:
             writer = AsyncMock()
             writer.close = MagicMock()
             writer.wait_closed = AsyncMock()
-            # Call handler - it will populate exception_holder and set shutdown_event
-            with patch("pclipsync.sync.run_sync_loop", new_callable=AsyncMock) as mock_sync:
+            writer.transport = MagicMock()
+            writer.get_extra_info = MagicMock(return_value=None)
+            # Call handler - it will populate exception_holder and resolve shutdown_future
+            with patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock) as mock_sync:
                 mock_sync.side_effect = error
                 await handler(reader, writer)
 
@@ -63,11 +65,11 @@ async def test_run_server_exits_cleanly_on_shutdown_before_client() -> None:
     """Test run_server exits cleanly when shutdown_requested before client connects."""
 
     # Mock all the X11 and socket setup at their source modules
-    with patch("pclipsync.clipboard.validate_display") as mock_display, \
-        patch("pclipsync.clipboard.create_hidden_window") as mock_window, \
-        patch("pclipsync.clipboard_events.register_xfixes_events"), \
-        patch("pclipsync.server_socket.check_socket_state"), \
-        patch("pclipsync.server_socket.print_startup_message"), \
+    with patch("pclipsync.server.validate_display") as mock_display, \
+        patch("pclipsync.server.create_hidden_window") as mock_window, \
+        patch("pclipsync.server.register_xfixes_events"), \
+        patch("pclipsync.server.check_socket_state"), \
+        patch("pclipsync.server.print_startup_message"), \
         patch("asyncio.start_unix_server") as mock_start_server:
 
         mock_display.return_value = MagicMock()
@@ -87,7 +89,7 @@ async def test_run_server_exits_cleanly_on_shutdown_before_client() -> None:
         original_add_signal_handler = asyncio.get_event_loop().add_signal_handler
 
         def capture_signal_handler(sig, callback):
-            # Store the callback (which is shutdown_requested.set)
+            # Store the callback (run_server's request_shutdown)
             shutdown_requested_ref.append(callback)
 
         with patch.object(
@@ -5,19 +5,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import asyncio
 
-from conftest_server_handler import (
-    mock_state,
-    mock_writer,
-    mock_shutdown_event,
-)
-
-# Re-export fixtures for pytest discovery
-__all__ = ["mock_state", "mock_writer", "mock_shutdown_event"]
+from pclipsync.sync_state import ClipboardState
 
 
 @pytest.mark.asyncio
 async def test_handle_client_runs_sync_loop_and_signals_shutdown(
-    mock_state: MagicMock, mock_writer: AsyncMock, mock_shutdown_event: MagicMock
+    mock_state: ClipboardState, mock_writer: AsyncMock, mock_shutdown_future: MagicMock
 ) -> None:
     """Test handle_client runs sync loop, cleans up, and signals shutdown."""
     from pclipsync.server_handler import handle_client
@@ -26,9 +19,9 @@ async def test_handle_client_runs_sync_loop_and_signals_shutdown(
     shutdown_requested = asyncio.Event()
     exception_holder: list[Exception] = []
 
-    with patch("pclipsync.sync.run_sync_loop", new_callable=AsyncMock) as mock_sync:
+    with patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock) as mock_sync:
         await handle_client(
-            mock_state, reader, mock_writer, mock_shutdown_event,
+            mock_state, reader, mock_writer, mock_shutdown_future,
             shutdown_requested, exception_holder
         )
 
@@ -37,37 +30,56 @@ async def test_handle_client_runs_sync_loop_and_signals_shutdown(
         )
         mock_writer.close.assert_called_once()
         mock_writer.wait_closed.assert_called_once()
-        mock_shutdown_event.set.assert_called_once()
+        mock_shutdown_future.set_result.assert_called_once_with(None)
 
 
 @pytest.mark.asyncio
 async def test_handle_client_handles_protocol_error(
-    mock_state: MagicMock, mock_writer: AsyncMock, mock_shutdown_event: MagicMock
+    mock_state: ClipboardState, mock_writer: AsyncMock, mock_shutdown_future: MagicMock
 ) -> None:
     """Test handle_client handles ProtocolError and still signals shutdown."""
     from pclipsync.protocol import ProtocolError
     from pclipsync.server_handler import handle_client
 
-    with patch("pclipsync.sync.run_sync_loop", new_callable=AsyncMock) as mock_sync:
+    with patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock) as mock_sync:
         mock_sync.side_effect = ProtocolError("connection closed")
         await handle_client(
-            mock_state, AsyncMock(), mock_writer, mock_shutdown_event,
+            mock_state, AsyncMock(), mock_writer, mock_shutdown_future,
             asyncio.Event(), []
         )
-        mock_shutdown_event.set.assert_called_once()
+        mock_shutdown_future.set_result.assert_called_once_with(None)
 
 
 @pytest.mark.asyncio
 async def test_handle_client_handles_connection_error(
-    mock_state: MagicMock, mock_writer: AsyncMock, mock_shutdown_event: MagicMock
+    mock_state: ClipboardState, mock_writer: AsyncMock, mock_shutdown_future: MagicMock
 ) -> None:
     """Test handle_client handles ConnectionError and still signals shutdown."""
     from pclipsync.server_handler import handle_client
 
-    with patch("pclipsync.sync.run_sync_loop", new_callable=AsyncMock) as mock_sync:
+    with patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock) as mock_sync:
         mock_sync.side_effect = ConnectionError("lost")
         await handle_client(
-            mock_state, AsyncMock(), mock_writer, mock_shutdown_event,
+            mock_state, AsyncMock(), mock_writer, mock_shutdown_future,
+            asyncio.Event(), []
+        )
+        mock_shutdown_future.set_result.assert_called_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_handle_client_leaves_resolved_shutdown_future_alone(
+    mock_state: ClipboardState, mock_writer: AsyncMock
+) -> None:
+    """Test handle_client tolerates a signal having resolved the future first."""
+    from pclipsync.server_handler import handle_client
+
+    shutdown_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    shutdown_future.set_result(None)
+
+    with patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock):
+        await handle_client(
+            mock_state, AsyncMock(), mock_writer, shutdown_future,
             asyncio.Event(), []
         )
-        mock_shutdown_event.set.assert_called_once()
+
+    assert shutdown_future.done()
@@ -6,19 +6,12 @@ import logging
 
 import pytest
 
-from conftest_server_handler import (
-    mock_state,
-    mock_writer,
-    mock_shutdown_event,
-)
-
-# Re-export fixtures for pytest discovery
-__all__ = ["mock_state", "mock_writer", "mock_shutdown_event"]
+from pclipsync.sync_state import ClipboardState
 
 
 @pytest.mark.asyncio
 async def test_handle_client_stores_protocol_error_in_exception_holder(
-    mock_state: MagicMock, mock_writer: AsyncMock, mock_shutdown_event: MagicMock,
+    mock_state: ClipboardState, mock_writer: AsyncMock, mock_shutdown_future: MagicMock,
     caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test handle_client stores ProtocolError in exception_holder and logs ERROR."""
@@ -29,12 +22,12 @@ async def test_handle_client_stores_protocol_error_in_exception_holder(
     error = ProtocolError("connection closed")
 
     with (
-        patch("pclipsync.sync.run_sync_loop", new_callable=AsyncMock) as mock_sync,
+        patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock) as mock_sync,
         caplog.at_level(logging.ERROR),
     ):
         mock_sync.side_effect = error
         await handle_client(
-            mock_state, AsyncMock(), mock_writer, mock_shutdown_event,
+            mock_state, AsyncMock(), mock_writer, mock_shutdown_future,
             asyncio.Event(), exception_holder
         )
 
@@ -45,7 +38,7 @@ async def test_handle_client_stores_protocol_error_in_exception_holder(
 
 @pytest.mark.asyncio
 async def test_handle_client_stores_connection_error_in_exception_holder(
-    mock_state: MagicMock, mock_writer: AsyncMock, mock_shutdown_event: MagicMock,
+    mock_state: ClipboardState, mock_writer: AsyncMock, mock_shutdown_future: MagicMock,
     caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test handle_client stores ConnectionError in exception_holder and logs ERROR."""
@@ -55,12 +48,12 @@ async def test_handle_client_stores_connection_error_in_exception_holder(
     error = ConnectionError("connection lost")
 
     with (
-        patch("pclipsync.sync.run_sync_loop", new_callable=AsyncMock) as mock_sync,
+        patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock) as mock_sync,
         caplog.at_level(logging.ERROR),
     ):
         mock_sync.side_effect = error
         await handle_client(
-            mock_state, AsyncMock(), mock_writer, mock_shutdown_event,
+            mock_state, AsyncMock(), mock_writer, mock_shutdown_future,
             asyncio.Event(), exception_holder
         )
 
@@ -71,7 +64,7 @@ async def test_handle_client_stores_connection_error_in_exception_holder(
 
 @pytest.mark.asyncio
 async def test_handle_client_logs_debug_on_clean_disconnect(
-    mock_state: MagicMock, mock_writer: AsyncMock, mock_shutdown_event: MagicMock,
+    mock_state: ClipboardState, mock_writer: AsyncMock, mock_shutdown_future: MagicMock,
     caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test handle_client logs at DEBUG on normal return (goodbye received)."""
@@ -80,11 +73,11 @@ async def test_handle_client_logs_debug_on_clean_disconnect(
     exception_holder: list[Exception] = []
 
     with (
-        patch("pclipsync.sync.run_sync_loop", new_callable=AsyncMock),
+        patch("pclipsync.server_handler.run_sync_loop", new_callable=AsyncMock),
         caplog.at_level(logging.DEBUG),
     ):
         await handle_client(
-            mock_state, AsyncMock(), mock_writer, mock_shutdown_event,
+            mock_state, AsyncMock(), mock_writer, mock_shutdown_future,
             asyncio.Event(), exception_holder
         )
 
@@ -5,9 +5,11 @@ Tests for server socket utilities.
 Tests check_socket_state for stale vs active sockets, print_startup_message
 output, and cleanup_socket behavior.
 """
+import errno
 import os
 import socket
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -53,6 +55,44 @@ class TestCheckSocketState:
             finally:
                 sock.close()
 
+    def test_inaccessible_socket_exits_with_error(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test check_socket_state exits when connect fails other than refused."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = os.path.join(tmpdir, "denied.sock")
+            with open(socket_path, "w"):
+                pass
+
+            with patch("pclipsync.server_socket.socket.socket") as mock_socket:
+                test_socket = mock_socket.return_value.__enter__.return_value
+                test_socket.connect_ex.return_value = errno.EACCES
+                with pytest.raises(SystemExit) as exc_info:
+                    check_socket_state(socket_path)
+
+            assert exc_info.value.code == 1
+            assert os.path.exists(socket_path)
+            assert "Cannot access socket" in capsys.readouterr().err
+
+    def test_connect_raising_oserror_exits_with_error(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test check_socket_state exits when connect_ex raises OSError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = os.path.join(tmpdir, "long.sock")
+            with open(socket_path, "w"):
+                pass
+
+            with patch("pclipsync.server_socket.socket.socket") as mock_socket:
+                test_socket = mock_socket.return_value.__enter__.return_value
+                test_socket.connect_ex.side_effect = OSError("AF_UNIX path too long")
+                with pytest.raises(SystemExit) as exc_info:
+                    check_socket_state(socket_path)
+
+            assert exc_info.value.code == 1
+            assert os.path.exists(socket_path)
+            assert "Cannot access socket" in capsys.readouterr().err
+
 
 class TestPrintStartupMessage:
     """Tests for print_startup_message function."""
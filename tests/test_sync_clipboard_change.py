@@ -33,7 +33,7 @@ async def test_handle_clipboard_change_skips_when_we_own_selection(
         await handle_clipboard_change(mock_clipboard_state, mock_writer, 1)
         # read_clipboard_content should NOT be called (early return)
         mock_read.assert_not_called()
-        mock_writer.write.assert_not_called()
+        mock_writer.writelines.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -48,7 +48,7 @@ async def test_handle_clipboard_change_skips_empty(
     ) as mock_read:
         mock_read.return_value = None
         await handle_clipboard_change(mock_clipboard_state, mock_writer, 1)
-        mock_writer.write.assert_not_called()
+        mock_writer.writelines.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -67,7 +67,7 @@ async def test_handle_clipboard_change_skips_duplicate(
     ) as mock_read:
         mock_read.return_value = content
         await handle_clipboard_change(mock_clipboard_state, mock_writer, 1)
-        mock_writer.write.assert_not_called()
+        mock_writer.writelines.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -86,4 +86,4 @@ async def test_handle_clipboard_change_skips_echo(
     ) as mock_read:
         mock_read.return_value = content
         await handle_clipboard_change(mock_clipboard_state, mock_writer, 1)
-        mock_writer.write.assert_not_called()
+        mock_writer.writelines.assert_not_called()
@@ -25,7 +25,7 @@ async def test_handle_clipboard_change_skips_oversized(
     ) as mock_read:
         mock_read.return_value = oversized_content
         await handle_clipboard_change(mock_clipboard_state, mock_writer, 1)
-        mock_writer.write.assert_not_called()
+        mock_writer.writelines.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -42,5 +42,7 @@ async def test_handle_clipboard_change_sends_new_content(
     ) as mock_read:
         mock_read.return_value = content
         await handle_clipboard_change(mock_clipboard_state, mock_writer, 1)
-        mock_writer.write.assert_called_once()
+        mock_writer.writelines.assert_called_once_with(
+            (b"%d:" % len(content), content, b",")
+        )
         mock_writer.drain.assert_called_once()
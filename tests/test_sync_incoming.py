@@ -10,19 +10,22 @@ import pytest
 
 
 
-def make_call_tracker(call_order: list[str], label: str) -> callable:
+def make_call_tracker(
+    call_order: list[str], label: str, result: object = True
+) -> callable:
     """Create a callback that records when it was called.
 
     Args:
         call_order: List to append call labels to.
         label: Label to append when this callback is invoked.
+        result: Value the callback returns.
 
     Returns:
-        A callable that appends label to call_order and returns True.
+        A callable that appends label to call_order and returns result.
     """
-    def tracker(*args: object, **kwargs: object) -> bool:
+    def tracker(*args: object, **kwargs: object) -> object:
         call_order.append(label)
-        return True
+        return result
     return tracker
 
 
@@ -40,11 +43,34 @@ async def test_handle_incoming_content_sets_hash_before_clipboard(
         call_order, "record_received"
     )
 
-    with patch("pclipsync.sync_handlers.set_clipboard_content") as mock_set, \
+    with patch("pclipsync.sync_handlers.set_clipboard_content_many") as mock_set, \
         patch("pclipsync.sync_handlers.get_server_timestamp", return_value=12345):
-        mock_set.side_effect = make_call_tracker(call_order, "set_clipboard")
+        mock_set.side_effect = make_call_tracker(call_order, "set_clipboard", [1])
         await handle_incoming_content(mock_clipboard_state, content)
 
     # Verify record_received was called before set_clipboard
     assert call_order[0] == "record_received"
     assert "set_clipboard" in call_order
+
+
+@pytest.mark.asyncio
+async def test_handle_incoming_content_logs_selection_not_acquired(
+    mock_clipboard_state: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a selection missing from the acquired list is logged."""
+    from Xlib import Xatom
+
+    from pclipsync.sync_handlers import handle_incoming_content
+
+    mock_clipboard_state.clipboard_atom = 999
+    mock_clipboard_state.owned_selections = {999, Xatom.PRIMARY}
+
+    with patch(
+        "pclipsync.sync_handlers.set_clipboard_content_many",
+        return_value=[Xatom.PRIMARY],
+    ), patch("pclipsync.sync_handlers.get_server_timestamp", return_value=1):
+        await handle_incoming_content(mock_clipboard_state, b"data")
+
+    assert "Failed to set CLIPBOARD selection" in caplog.text
+    assert "Failed to set PRIMARY selection" not in caplog.text
+    assert mock_clipboard_state.owned_selections == {Xatom.PRIMARY}
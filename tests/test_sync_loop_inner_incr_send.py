@@ -272,7 +272,7 @@ def test_small_content_selection_request_regression() -> None:
     mock_event.selection = 789
     mock_event.time = 0
 
-    # Configure intern_atom to return known values for target matching
+    # Configure get_atom to return known values for target matching
     def mock_intern(name: str) -> int:
         atoms = {
             "UTF8_STRING": 456,
@@ -282,7 +282,7 @@ def test_small_content_selection_request_regression() -> None:
         }
         return atoms.get(name, 0)
 
-    mock_display.intern_atom.side_effect = mock_intern
+    mock_display.get_atom.side_effect = mock_intern
 
     pending_incr_sends: dict[tuple[int, int], IncrSendState] = {}
     incr_atom = 999
@@ -65,3 +65,29 @@ async def test_partial_ownership_loss_keeps_acquisition_time(
     assert 2 in mock_clipboard_state.owned_selections
     # acquisition_time should NOT be cleared (we still own PRIMARY)
     assert mock_clipboard_state.acquisition_time == 555666777
+
+
+@pytest.mark.asyncio
+async def test_own_ownership_event_skips_clipboard_read(
+    mock_clipboard_state: MagicMock, mock_writer: AsyncMock
+) -> None:
+    """Test our own SetSelectionOwner event does not trigger a clipboard read."""
+    mock_clipboard_state.acquisition_time = 555666777
+    mock_clipboard_state.owned_selections = {1}
+
+    # Event reports our own window (state.window.id) as the new owner
+    event = make_owner_event(owner_id=12345, timestamp=888999000)
+
+    with patch(
+        "pclipsync.sync_loop_inner.process_pending_events"
+    ) as mock_pending, patch(
+        "pclipsync.sync_loop_inner.handle_clipboard_change", new_callable=AsyncMock
+    ) as mock_handler:
+        mock_pending.return_value = [event]
+
+        from pclipsync.sync_loop_inner import process_x11_events
+        await process_x11_events(mock_clipboard_state, mock_writer)
+
+    mock_handler.assert_not_called()
+    assert mock_clipboard_state.owned_selections == {1}
+    assert mock_clipboard_state.acquisition_time == 555666777
@@ -45,6 +45,7 @@ def create_test_state() -> MagicMock:
     """Create a standard mock state for tests."""
     state = MagicMock()
     state.display = MagicMock()
+    state.display.pending_events.return_value = 0
     state.x11_event = asyncio.Event()
     state.pending_incr_sends = {}
     return state
@@ -98,3 +99,60 @@ async def test_new_read_task_created_after_previous_completes() -> None:
 
     assert get_read_count() == 2, f"Expected 2 calls, got {get_read_count()}"
     mock_handle.assert_called_once_with(state, b"first message")
+
+
+@pytest.mark.asyncio
+async def test_x11_waiter_survives_network_messages() -> None:
+    """Verify network wakeups reuse the pending x11_event waiter."""
+    state = create_test_state()
+    async def never_set() -> None:
+        await asyncio.sleep(10)
+
+    state.x11_event = MagicMock()
+    state.x11_event.wait = AsyncMock(side_effect=never_set)
+    reader, writer = MagicMock(), AsyncMock()
+    shutdown_requested = asyncio.Event()
+    messages = [b"first", b"second"]
+
+    async def two_messages(reader: asyncio.StreamReader) -> bytes:
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(10)
+        return b"never reached"
+
+    read_patch = patch("pclipsync.sync_loop_inner.read_netstring", two_messages)
+    incoming_patch = patch(
+        "pclipsync.sync_loop_inner.handle_incoming_content", AsyncMock()
+    )
+
+    with read_patch, incoming_patch as mock_incoming:
+        from pclipsync.sync_loop_inner import sync_loop_inner
+        task = asyncio.create_task(sync_loop_inner(state, reader, writer, shutdown_requested))
+        await asyncio.sleep(0.01)
+        await cancel_task_safely(task)
+
+    assert mock_incoming.call_count == 2
+    assert state.x11_event.wait.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_x11_events_queued_during_processing_are_handled() -> None:
+    """Verify events Xlib queued while processing trigger another pass."""
+    state = create_test_state()
+    # One event is left in Xlib's queue after the first pass
+    state.display.pending_events.side_effect = [1, 0]
+    reader, writer = MagicMock(), AsyncMock()
+    shutdown_requested = asyncio.Event()
+
+    read_patch = patch("pclipsync.sync_loop_inner.read_netstring", make_slow_read)
+    proc_patch = patch("pclipsync.sync_loop_inner.process_x11_events", AsyncMock())
+
+    with read_patch, proc_patch as mock_process:
+        from pclipsync.sync_loop_inner import sync_loop_inner
+        task = asyncio.create_task(sync_loop_inner(state, reader, writer, shutdown_requested))
+        await asyncio.sleep(0.01)
+        state.x11_event.set()
+        await asyncio.sleep(0.01)
+        await cancel_task_safely(task)
+
+    assert mock_process.call_count == 2